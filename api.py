@@ -33,7 +33,7 @@ from web_scraper import scrape_company_data
 from email_sender import get_email_sender
 from business_intelligence import BusinessIntelligenceAnalyzer
 from avatar_service import get_avatar_service
-from context_aware_lead_generator import generate_leads_from_website
+from context_aware_lead_generator import generate_leads_from_website, to_json_bytes
 from africastalking_service import get_africastalking_service
 from fastapi.responses import Response
 import base64
@@ -815,10 +815,10 @@ async def generate_leads_from_user_website(request: WebsiteBasedLeadRequest):
         # Step 2: Optionally enhance with web scraping
         if request.enable_web_scraping:
             logger.info("Enhancing leads with web scraping...")
-            from web_scraper import scrape_company_data_parallel
+            from web_scraper import scrape_company_data_async
             leads_data = {'companies': leads}
-            # Use parallel scraping for faster performance
-            enhanced_data = scrape_company_data_parallel(leads_data, max_workers=3)
+            # Scrape all lead websites concurrently without blocking the event loop
+            enhanced_data = await scrape_company_data_async(leads_data)
             leads = enhanced_data.get('companies', leads)
         
         # Step 3: Optionally add business intelligence analysis
@@ -862,7 +862,9 @@ async def generate_leads_from_user_website(request: WebsiteBasedLeadRequest):
         
         logger.info(f"Generated {len(leads)} contextual leads from website analysis")
         
-        return {
+        # Encoded directly (orjson when available) instead of going through
+        # FastAPI's jsonable_encoder, which walks every nested lead
+        payload = {
             "success": True,
             "message": f"Generated {len(leads)} contextually relevant leads from website analysis",
             "data": {
@@ -882,6 +884,7 @@ async def generate_leads_from_user_website(request: WebsiteBasedLeadRequest):
                 "generated_at": datetime.utcnow().isoformat()
             }
         }
+        return Response(content=to_json_bytes(payload), media_type="application/json")
         
     except HTTPException:
         raise
@@ -5,15 +5,200 @@ based on ideal customer profile (ICP) criteria.
 """
 
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from bs4 import BeautifulSoup, Tag
+from typing import Any, Dict, List, Optional, Set, Tuple
 import re
 from urllib.parse import urljoin
 import time
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# selectolax (lexbor) is optional - it parses and runs CSS selectors in C,
+# which is much faster than BeautifulSoup for the read-only queries below
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson is optional - used for fast batch result dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+# hyperscan is optional - it finds phone numbers and emails in a single
+# DFA pass instead of two backtracking regex scans
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# A parsed page: a LexborHTMLParser tree when selectolax is installed,
+# otherwise a BeautifulSoup document
+Document = Any
+
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+# business_info keys read by score_lead
+SCORING_FIELDS = frozenset({
+    'website_quality_score', 'contact_accessibility', 'social_proof',
+    'blog_activity', 'careers_page', 'about_page_quality'
+})
+
+# Count fields _analyze_social_proof is computed from
+_SOCIAL_PROOF_INPUTS = frozenset({
+    'testimonials', 'case_studies', 'awards_certifications', 'partnerships'
+})
+
+
+def _class_selector(tags: Tuple[str, ...], words: Tuple[str, ...]) -> str:
+    """Build a CSS selector for tags whose class attribute contains any of the words"""
+    return ', '.join(f'{tag}[class*="{word}" i]' for tag in tags for word in words)
+
+
+# Section selectors, built once at import
+_HERO_SELECTOR = _class_selector(('section', 'div'), ('hero', 'banner', 'intro'))
+_SERVICE_SELECTOR = _class_selector(('section', 'div'), ('service', 'product', 'offering', 'solution'))
+_PRICING_SELECTOR = _class_selector(('section', 'div'), ('pricing', 'price', 'plan'))
+_TEAM_SELECTOR = _class_selector(('section', 'div'), ('team',))
+_TEAM_MEMBER_SELECTOR = _class_selector(('div', 'article'), ('member', 'employee', 'staff'))
+_CONTACT_FORM_SELECTOR = _class_selector(('form',), ('contact',))
+
+# Social proof sections are classified in a single walk over section/div
+# nodes; a node lands in every bucket whose words its class contains
+_SECTION_CLASSIFIER = re.compile(
+    r'(?P<testimonial>testimonial|review|client)'
+    r'|(?P<partner>partner|integration)'
+    r'|(?P<award>award|certification|recognition)',
+    re.I
+)
+_SECTION_BUCKET_FIELDS = frozenset({'testimonials', 'partnerships', 'awards_certifications'})
+
+# Patterns CSS can't express cleanly are matched against attribute values
+_CASE_STUDY_HREF_RE = re.compile('case.study|success.story|case-study', re.I)
+_BLOG_HREF_RE = re.compile('blog|news|article', re.I)
+_CAREERS_HREF_RE = re.compile('career|job|hiring', re.I)
+_ABOUT_HREF_RE = re.compile('about', re.I)
+_CONTACT_HREF_RE = re.compile('contact', re.I)
+_CLIENT_LOGO_ALT_RE = re.compile('client|customer|partner', re.I)
+_DECIMAL_RE = re.compile(r'[\d.]+')
+_INTEGER_RE = re.compile(r'\d+')
+_PRICE_RE = re.compile(r'\$[\d,]+|€[\d,]+|£[\d,]+|KES\s?[\d,]+|USD\s?[\d,]+')
+
+# Contact details in page text. The phone pattern must start and end on a
+# digit so long runs of spaces/punctuation can't trigger heavy backtracking.
+_PHONE_PATTERN = r'\+?\d[\d\-\s().]{8,}\d'
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+_PHONE_RE = re.compile(_PHONE_PATTERN)
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_PHONE_ID, _EMAIL_ID = 0, 1
+
+
+def _build_contact_database():
+    """Compile the phone and email patterns into one hyperscan database"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_PHONE_PATTERN.encode(), _EMAIL_PATTERN.encode()],
+            ids=[_PHONE_ID, _EMAIL_ID],
+            elements=2,
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * 2,
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"hyperscan unavailable, using re for contact scan: {str(e)}")
+        return None
+
+
+_CONTACT_DB = _build_contact_database()
+_CONTACT_DB_LOCK = threading.Lock()
+
+
+def _scan_contact_details(page_text: str) -> Tuple[bool, bool]:
+    """Return (has_phone, has_email) for the page text"""
+    if _CONTACT_DB is None:
+        return _PHONE_RE.search(page_text) is not None, _EMAIL_RE.search(page_text) is not None
+    
+    found = set()
+    
+    def on_match(match_id, start, end, flags, context):
+        found.add(match_id)
+        # Stop scanning once both patterns have matched
+        return len(found) == 2
+    
+    # A database owns a single scratch space, so scans must not overlap
+    with _CONTACT_DB_LOCK:
+        try:
+            _CONTACT_DB.scan(page_text.encode('utf-8', 'ignore'), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+    return _PHONE_ID in found, _EMAIL_ID in found
+
+
+def _parse(response: requests.Response) -> Document:
+    """Parse a response with lexbor when available, BeautifulSoup otherwise"""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(response.content)
+    return BeautifulSoup(response.text, 'html.parser')
+
+
+def _select(node, selector: str) -> List:
+    """All nodes under node matching a CSS selector"""
+    if isinstance(node, Tag):
+        return node.select(selector)
+    # lexbor yields a node once per matching selector in a group; dedupe
+    seen = set()
+    return [n for n in node.css(selector) if not (n.mem_id in seen or seen.add(n.mem_id))]
+
+
+def _select_one(node, selector: str):
+    """First node under node matching a CSS selector, or None"""
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+
+def _text(node, strip: bool = False) -> str:
+    """Text content of a node"""
+    if isinstance(node, Tag):
+        return node.get_text(strip=strip)
+    return node.text(strip=strip)
+
+
+def _attr(node, name: str) -> Optional[str]:
+    """Attribute value of a node, or None"""
+    if isinstance(node, Tag):
+        return node.get(name)
+    return node.attributes.get(name)
+
+
+def _classes(node) -> str:
+    """Space-separated class attribute of a node"""
+    classes = _attr(node, 'class') or ''
+    return ' '.join(classes) if isinstance(classes, list) else classes
+
+
+def _classify_sections(soup: Document) -> Dict[str, List]:
+    """Bucket section/div nodes by the social proof categories their class matches"""
+    buckets = {'testimonial': [], 'partner': [], 'award': []}
+    for node in _select(soup, 'section[class], div[class]'):
+        for category in {m.lastgroup for m in _SECTION_CLASSIFIER.finditer(_classes(node))}:
+            buckets[category].append(node)
+    return buckets
+
+
+def _links_matching(node, pattern: re.Pattern) -> List:
+    """Anchors under node whose href matches pattern"""
+    return [a for a in _select(node, 'a[href]') if pattern.search(_attr(a, 'href') or '')]
+
 
 class BusinessIntelligenceAnalyzer:
     """
@@ -21,18 +206,30 @@ class BusinessIntelligenceAnalyzer:
     and score leads based on ideal customer profile (ICP) criteria.
     """
     
+    # Keyword sets scanned against the lowercased page text
+    AUDIENCE_KEYWORDS = (
+        'enterprise', 'sme', 'startup', 'small business',
+        'b2b', 'b2c', 'non-profit', 'government', 'ngo'
+    )
+    
+    TECH_KEYWORDS = (
+        'api', 'cloud', 'saas', 'ai', 'machine learning',
+        'blockchain', 'mobile app', 'web app', 'api integration'
+    )
+    
     def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # Shared, read-only request headers
+        self.headers = _DEFAULT_HEADERS
         self.timeout = 10
     
-    def extract_business_info(self, website_url: str) -> Dict:
+    def extract_business_info(self, website_url: str, fields: Optional[Set[str]] = None) -> Dict:
         """
         Extract comprehensive business information from website.
         
         Args:
             website_url: URL of the company website
+            fields: Optional set of business_info keys to compute (e.g.
+                SCORING_FIELDS). All fields are computed when None.
         
         Returns:
             Dictionary containing business intelligence data
@@ -40,28 +237,46 @@ class BusinessIntelligenceAnalyzer:
         try:
             response = requests.get(website_url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = _parse(response)
+            
+            # Social proof is built from the four count fields
+            if fields is not None and 'social_proof' in fields:
+                fields = fields | _SOCIAL_PROOF_INPUTS
+            
+            # Classify social proof sections in one walk
+            if fields is None or fields & _SECTION_BUCKET_FIELDS:
+                buckets = _classify_sections(soup)
+            
+            # Lowercase the page text once and share it across keyword scans
+            if fields is None or fields & {'target_audience', 'technology_stack'}:
+                page_text_lower = _text(soup).lower()
             
-            # Extract various business signals
-            business_info = {
-                'company_description': self._extract_description(soup),
-                'services_products': self._extract_products_services(soup),
-                'target_audience': self._extract_target_audience(soup),
-                'pricing_info': self._extract_pricing(soup),
-                'testimonials': self._extract_testimonials(soup),
-                'case_studies': self._extract_case_studies(soup),
-                'team_size_indicators': self._extract_team_info(soup),
-                'technology_stack': self._extract_tech_stack(soup),
-                'partnerships': self._extract_partnerships(soup),
-                'awards_certifications': self._extract_awards(soup),
-                'blog_activity': self._check_blog_activity(soup, website_url),
-                'careers_page': self._check_careers_page(soup, website_url),
-                'about_page_quality': self._analyze_about_page(soup, website_url),
-                'contact_accessibility': self._analyze_contact_accessibility(soup),
-                'social_proof': self._analyze_social_proof(soup),
-                'website_quality_score': self._calculate_website_quality(soup)
+            extractors = {
+                'company_description': lambda: self._extract_description(soup),
+                'services_products': lambda: self._extract_products_services(soup),
+                'target_audience': lambda: self._extract_target_audience(page_text_lower),
+                'pricing_info': lambda: self._extract_pricing(soup),
+                'testimonials': lambda: self._extract_testimonials(buckets),
+                'case_studies': lambda: self._extract_case_studies(soup),
+                'team_size_indicators': lambda: self._extract_team_info(soup),
+                'technology_stack': lambda: self._extract_tech_stack(page_text_lower),
+                'partnerships': lambda: self._extract_partnerships(buckets),
+                'awards_certifications': lambda: self._extract_awards(buckets),
+                'blog_activity': lambda: self._check_blog_activity(soup, website_url),
+                'careers_page': lambda: self._check_careers_page(soup, website_url),
+                'about_page_quality': lambda: self._analyze_about_page(soup, website_url),
+                'contact_accessibility': lambda: self._analyze_contact_accessibility(soup),
+                # Social proof reuses the counts gathered above
+                'social_proof': lambda: self._analyze_social_proof(soup, business_info),
+                'website_quality_score': lambda: self._calculate_website_quality(soup),
             }
             
+            # Extract the requested business signals, skipping the rest
+            business_info = {}
+            for name, extract in extractors.items():
+                if fields is None or name in fields:
+                    business_info[name] = extract()
+            
             return business_info
             
         except requests.exceptions.RequestException as e:
@@ -71,69 +286,54 @@ class BusinessIntelligenceAnalyzer:
             logger.error(f"Unexpected error analyzing {website_url}: {str(e)}")
             return {'error': str(e)}
     
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_description(self, soup: Document) -> Optional[str]:
         """Extract company description from meta tags and hero sections"""
         # Try meta description first
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc['content']
+        meta_desc = _select_one(soup, 'meta[name="description"]')
+        if meta_desc and _attr(meta_desc, 'content'):
+            return _attr(meta_desc, 'content')
         
         # Try Open Graph description
-        og_desc = soup.find('meta', attrs={'property': 'og:description'})
-        if og_desc and og_desc.get('content'):
-            return og_desc['content']
+        og_desc = _select_one(soup, 'meta[property="og:description"]')
+        if og_desc and _attr(og_desc, 'content'):
+            return _attr(og_desc, 'content')
         
         # Try hero section
-        hero = soup.find(['section', 'div'], class_=re.compile('hero|banner|intro', re.I))
+        hero = _select_one(soup, _HERO_SELECTOR)
         if hero:
-            text = hero.get_text(strip=True)
+            text = _text(hero, strip=True)
             if len(text) > 50:
                 return text[:500]
         
         return None
     
-    def _extract_products_services(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_products_services(self, soup: Document) -> List[str]:
         """Extract products/services from website"""
         services = []
         
         # Look for services/products sections
-        service_sections = soup.find_all(['section', 'div'], 
-                                        class_=re.compile('service|product|offering|solution', re.I))
+        service_sections = _select(soup, _SERVICE_SELECTOR)
         
         for section in service_sections:
-            headings = section.find_all(['h2', 'h3', 'h4'])
+            headings = _select(section, 'h2, h3, h4')
             for heading in headings:
-                text = heading.get_text(strip=True)
+                text = _text(heading, strip=True)
                 if text and len(text) < 100:
                     services.append(text)
         
         return list(set(services[:10]))  # Return top 10 unique
     
-    def _extract_target_audience(self, soup: BeautifulSoup) -> List[str]:
-        """Extract target audience indicators"""
-        audience_keywords = [
-            'enterprise', 'sme', 'startup', 'small business', 
-            'b2b', 'b2c', 'non-profit', 'government', 'ngo'
-        ]
-        
-        found_audiences = []
-        page_text = soup.get_text().lower()
-        
-        for keyword in audience_keywords:
-            if keyword in page_text:
-                found_audiences.append(keyword)
-        
-        return found_audiences
+    def _extract_target_audience(self, page_text_lower: str) -> List[str]:
+        """Extract target audience indicators from lowercased page text"""
+        return [keyword for keyword in self.AUDIENCE_KEYWORDS if keyword in page_text_lower]
     
-    def _extract_pricing(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_pricing(self, soup: Document) -> Optional[Dict]:
         """Extract pricing information"""
-        pricing_section = soup.find(['section', 'div'], 
-                                   class_=re.compile('pricing|price|plan', re.I))
+        pricing_section = _select_one(soup, _PRICING_SELECTOR)
         
         if pricing_section:
             # Look for price indicators
-            price_pattern = r'\$[\d,]+|€[\d,]+|£[\d,]+|KES\s?[\d,]+|USD\s?[\d,]+'
-            prices = re.findall(price_pattern, pricing_section.get_text())
+            prices = _PRICE_RE.findall(_text(pricing_section))
             
             if prices:
                 return {
@@ -143,26 +343,21 @@ class BusinessIntelligenceAnalyzer:
         
         return None
     
-    def _extract_testimonials(self, soup: BeautifulSoup) -> int:
-        """Count testimonials/reviews"""
-        testimonial_sections = soup.find_all(['section', 'div'], 
-                                           class_=re.compile('testimonial|review|client', re.I))
-        return len(testimonial_sections)
+    def _extract_testimonials(self, buckets: Dict[str, List]) -> int:
+        """Count testimonials/reviews from the classified sections"""
+        return len(buckets['testimonial'])
     
-    def _extract_case_studies(self, soup: BeautifulSoup) -> int:
+    def _extract_case_studies(self, soup: Document) -> int:
         """Count case studies"""
-        case_study_links = soup.find_all('a', href=re.compile('case.study|success.story|case-study', re.I))
-        return len(case_study_links)
+        return len(_links_matching(soup, _CASE_STUDY_HREF_RE))
     
-    def _extract_team_info(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_team_info(self, soup: Document) -> Optional[Dict]:
         """Extract team size indicators"""
-        team_section = soup.find(['section', 'div'], 
-                               class_=re.compile('team|about.team|our.team', re.I))
+        team_section = _select_one(soup, _TEAM_SELECTOR)
         
         if team_section:
             # Count team member mentions
-            team_members = team_section.find_all(['div', 'article'], 
-                                                class_=re.compile('member|employee|staff', re.I))
+            team_members = _select(team_section, _TEAM_MEMBER_SELECTOR)
             return {
                 'has_team_page': True,
                 'team_member_count': len(team_members)
@@ -170,37 +365,21 @@ class BusinessIntelligenceAnalyzer:
         
         return None
     
-    def _extract_tech_stack(self, soup: BeautifulSoup) -> List[str]:
-        """Extract technology stack indicators"""
-        tech_keywords = [
-            'api', 'cloud', 'saas', 'ai', 'machine learning', 
-            'blockchain', 'mobile app', 'web app', 'api integration'
-        ]
-        
-        found_tech = []
-        page_text = soup.get_text().lower()
-        
-        for tech in tech_keywords:
-            if tech in page_text:
-                found_tech.append(tech)
-        
-        return found_tech
+    def _extract_tech_stack(self, page_text_lower: str) -> List[str]:
+        """Extract technology stack indicators from lowercased page text"""
+        return [tech for tech in self.TECH_KEYWORDS if tech in page_text_lower]
     
-    def _extract_partnerships(self, soup: BeautifulSoup) -> int:
-        """Count partnership mentions"""
-        partnership_sections = soup.find_all(['section', 'div'], 
-                                            class_=re.compile('partner|integration', re.I))
-        return len(partnership_sections)
+    def _extract_partnerships(self, buckets: Dict[str, List]) -> int:
+        """Count partnership mentions from the classified sections"""
+        return len(buckets['partner'])
     
-    def _extract_awards(self, soup: BeautifulSoup) -> int:
-        """Count awards/certifications"""
-        award_sections = soup.find_all(['section', 'div'], 
-                                     class_=re.compile('award|certification|recognition', re.I))
-        return len(award_sections)
+    def _extract_awards(self, buckets: Dict[str, List]) -> int:
+        """Count awards/certifications from the classified sections"""
+        return len(buckets['award'])
     
-    def _check_blog_activity(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def _check_blog_activity(self, soup: Document, base_url: str) -> Dict:
         """Check if company has active blog"""
-        blog_links = soup.find_all('a', href=re.compile('blog|news|article', re.I))
+        blog_links = _links_matching(soup, _BLOG_HREF_RE)
         
         if blog_links:
             return {
@@ -210,14 +389,14 @@ class BusinessIntelligenceAnalyzer:
         
         return {'has_blog': False}
     
-    def _check_careers_page(self, soup: BeautifulSoup, base_url: str) -> bool:
+    def _check_careers_page(self, soup: Document, base_url: str) -> bool:
         """Check if company has careers page (indicates growth)"""
-        careers_links = soup.find_all('a', href=re.compile('career|job|hiring', re.I))
+        careers_links = _links_matching(soup, _CAREERS_HREF_RE)
         return len(careers_links) > 0
     
-    def _analyze_about_page(self, soup: BeautifulSoup, base_url: str) -> Dict:
+    def _analyze_about_page(self, soup: Document, base_url: str) -> Dict:
         """Analyze about page quality"""
-        about_links = soup.find_all('a', href=re.compile('about', re.I))
+        about_links = _links_matching(soup, _ABOUT_HREF_RE)
         
         if about_links:
             return {
@@ -227,13 +406,14 @@ class BusinessIntelligenceAnalyzer:
         
         return {'has_about_page': False}
     
-    def _analyze_contact_accessibility(self, soup: BeautifulSoup) -> Dict:
+    def _analyze_contact_accessibility(self, soup: Document) -> Dict:
         """Analyze how easy it is to contact the company"""
+        has_phone, has_email = _scan_contact_details(_text(soup))
         contact_indicators = {
-            'has_contact_page': len(soup.find_all('a', href=re.compile('contact', re.I))) > 0,
-            'has_phone': len(re.findall(r'\+?[\d\s\-\(\)]{10,}', soup.get_text())) > 0,
-            'has_email': len(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', soup.get_text())) > 0,
-            'has_contact_form': len(soup.find_all('form', class_=re.compile('contact', re.I))) > 0
+            'has_contact_page': len(_links_matching(soup, _CONTACT_HREF_RE)) > 0,
+            'has_phone': has_phone,
+            'has_email': has_email,
+            'has_contact_form': _select_one(soup, _CONTACT_FORM_SELECTOR) is not None
         }
         
         score = sum(contact_indicators.values())
@@ -243,14 +423,17 @@ class BusinessIntelligenceAnalyzer:
             'accessibility_level': 'high' if score >= 3 else 'medium' if score == 2 else 'low'
         }
     
-    def _analyze_social_proof(self, soup: BeautifulSoup) -> Dict:
-        """Analyze social proof indicators"""
+    def _analyze_social_proof(self, soup: Document, already: Dict) -> Dict:
+        """Analyze social proof indicators using counts already in business_info"""
         social_proof = {
-            'testimonials_count': self._extract_testimonials(soup),
-            'case_studies_count': self._extract_case_studies(soup),
-            'awards_count': self._extract_awards(soup),
-            'partnerships_count': self._extract_partnerships(soup),
-            'has_client_logos': len(soup.find_all('img', alt=re.compile('client|customer|partner', re.I))) > 0
+            'testimonials_count': already['testimonials'],
+            'case_studies_count': already['case_studies'],
+            'awards_count': already['awards_certifications'],
+            'partnerships_count': already['partnerships'],
+            'has_client_logos': any(
+                _CLIENT_LOGO_ALT_RE.search(_attr(img, 'alt') or '')
+                for img in _select(soup, 'img[alt]')
+            )
         }
         
         total_score = (
@@ -267,15 +450,15 @@ class BusinessIntelligenceAnalyzer:
             'social_proof_level': 'high' if total_score >= 15 else 'medium' if total_score >= 8 else 'low'
         }
     
-    def _calculate_website_quality(self, soup: BeautifulSoup) -> Dict:
+    def _calculate_website_quality(self, soup: Document) -> Dict:
         """Calculate overall website quality score"""
         quality_indicators = {
-            'has_meta_description': soup.find('meta', attrs={'name': 'description'}) is not None,
-            'has_og_tags': soup.find('meta', attrs={'property': 'og:title'}) is not None,
-            'has_favicon': soup.find('link', rel='icon') is not None,
-            'has_structured_data': len(soup.find_all('script', type='application/ld+json')) > 0,
-            'mobile_responsive': 'viewport' in str(soup.find('meta', attrs={'name': 'viewport'})),
-            'has_sitemap': soup.find('link', rel='sitemap') is not None
+            'has_meta_description': _select_one(soup, 'meta[name="description"]') is not None,
+            'has_og_tags': _select_one(soup, 'meta[property="og:title"]') is not None,
+            'has_favicon': _select_one(soup, 'link[rel~="icon"]') is not None,
+            'has_structured_data': _select_one(soup, 'script[type="application/ld+json"]') is not None,
+            'mobile_responsive': _select_one(soup, 'meta[name="viewport"]') is not None,
+            'has_sitemap': _select_one(soup, 'link[rel~="sitemap"]') is not None
         }
         
         score = sum(quality_indicators.values())
@@ -367,7 +550,7 @@ class BusinessIntelligenceAnalyzer:
         revenue = company_data.get('revenue_market_cap', '')
         if revenue:
             # Extract numbers from revenue string
-            revenue_nums = re.findall(r'[\d.]+', revenue.replace(',', ''))
+            revenue_nums = _DECIMAL_RE.findall(revenue.replace(',', ''))
             if revenue_nums:
                 try:
                     revenue_value = float(revenue_nums[0])
@@ -398,7 +581,7 @@ class BusinessIntelligenceAnalyzer:
             
             if ideal_customer_profile.get('min_employees'):
                 # Extract employee count from company_size
-                emp_nums = re.findall(r'\d+', company_size.replace(',', ''))
+                emp_nums = _INTEGER_RE.findall(company_size.replace(',', ''))
                 if emp_nums:
                     try:
                         emp_count = int(emp_nums[0])
@@ -437,17 +620,25 @@ class BusinessIntelligenceAnalyzer:
         }
 
 
-def analyze_company_intelligence(company_data: Dict) -> Dict:
+# Stateless, so one instance serves every analyze_company_intelligence call
+_SHARED_ANALYZER = BusinessIntelligenceAnalyzer()
+
+
+def analyze_company_intelligence(company_data: Dict,
+                                 ideal_customer_profile: Optional[Dict] = None) -> Dict:
     """
     Convenience function to analyze a single company's business intelligence.
     
+    Only the fields score_lead reads are extracted from the website.
+    
     Args:
         company_data: Company data dictionary with website_url
+        ideal_customer_profile: Optional ICP criteria passed to score_lead
     
     Returns:
         Dictionary with business intelligence and lead score
     """
-    analyzer = BusinessIntelligenceAnalyzer()
+    analyzer = _SHARED_ANALYZER
     website_url = company_data.get('website_url')
     
     if not website_url:
@@ -459,10 +650,30 @@ def analyze_company_intelligence(company_data: Dict) -> Dict:
         }
     
     # Extract business intelligence
-    business_info = analyzer.extract_business_info(website_url)
+    # ICP matching reads company_data only, so the scoring fields suffice
+    business_info = analyzer.extract_business_info(website_url, fields=SCORING_FIELDS)
     
     # Score the lead
-    lead_scoring = analyzer.score_lead(company_data, business_info)
+    lead_scoring = analyzer.score_lead(company_data, business_info, ideal_customer_profile)
     
     return lead_scoring
 
+
+def dump_results(path: str, results: List[Dict]) -> None:
+    """
+    Write scored leads (e.g. score_lead / analyze_company_intelligence output)
+    to a JSON file.
+    
+    Uses orjson when installed, which encodes straight to bytes and is
+    several times faster than the json module on large batches.
+    
+    Args:
+        path: Output file path
+        results: List of lead dictionaries
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(results, f)
@@ -4,15 +4,128 @@ Generates tailored leads based on business insights extracted from user's websit
 """
 
 import os
+import re
 import json
+import heapq
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import aiohttp
+from string import Template
+from typing import Callable, Dict, List, Optional, Tuple
 from generate_health_insurance import GeminiClient
-from website_content_analyzer import analyze_website_content
+from website_content_analyzer import WebsiteContent, analyze_website_content, analyze_website_content_async
 from business_insights_extractor import extract_business_insights
+from disk_cache import DiskCache, url_cache_key
+from semantic_cache import get_semantic_cache
+from keyword_matcher import KeywordMatcher
+
+try:
+    import numpy as np
+except ImportError:  # Optional: relevance scoring falls back to a per-lead loop
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional: to_json_bytes falls back to json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Multi-website generation limits
+ANALYSIS_CONCURRENCY = 8  # Websites analyzed (or leads generated) at once
+CONNECTION_POOL_SIZE = 32  # Total open connections in the shared session
+
+# How long a site's last analysis is kept after its wc:/insights: entries
+# expire, so re-runs can revalidate with ETag/Last-Modified instead of
+# re-extracting insights
+REVALIDATION_TTL = 30 * 86400  # 30 days
+
+# Keywords looked up in lead fields and offerings; found in one pass per string
+_KEYWORD_MATCHER = KeywordMatcher((
+    '50+', '100+', '500+', '1000+',
+    'consumer', 'individual', 'enterprise', 'small', 'b2b', 'business',
+    'saas', 'software', 'fintech', 'payment'
+))
+
+
+# Lead-generation prompt tailored to the user's business (parsed once)
+_TAILORED_PROMPT = Template("""
+        Generate $number highly relevant leads for a business that:
+        
+        Industry: $industry
+        Target Audience: $target_audience
+        Business Model: $business_model
+        Key Offerings: $offerings
+        Value Proposition: $value_proposition
+        
+        Focus on companies in $country that would be ideal customers, partners, or prospects
+        for this business. Prioritize companies that:
+        1. Operate in complementary or related industries
+        2. Serve similar target audiences ($target_audience)
+        3. Could benefit from the offerings mentioned
+        4. Are in a position to engage (growth stage, expanding, etc.)
+        
+        Return comprehensive company information including contact details.
+        """)
+
+# Variable part of a generation request, embedded as the semantic cache key.
+# Only these fields: shared boilerplate would make every profile look alike
+_CACHE_PROFILE = Template(
+    "Industry: $industry\n"
+    "Target audience: $target_audience\n"
+    "Business model: $business_model\n"
+    "Offerings: $offerings\n"
+    "Value proposition: $value_proposition"
+)
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def _make_geo_matcher(geographic_focus: List[str]) -> Callable[[str], bool]:
+    """
+    Build a function telling whether a lowercase location is in one of the
+    given countries/regions.
+    
+    Single-word names are matched against the location's words with one
+    set lookup (so 'niger' no longer matches 'nigeria'); multi-word names
+    such as 'south africa' fall back to a substring check.
+    """
+    words = set()
+    phrases = []
+    for place in geographic_focus:
+        place = place.strip().lower()
+        if _WORD_RE.fullmatch(place):
+            words.add(place)
+        elif place:
+            phrases.append(place)
+    words = frozenset(words)
+    phrases = tuple(phrases)
+    
+    def matches(location: str) -> bool:
+        if words and not words.isdisjoint(_WORD_RE.findall(location)):
+            return True
+        return any(phrase in location for phrase in phrases)
+    
+    return matches
+
+
+# Below this many leads the per-lead scoring loop beats building NumPy arrays
+VECTORIZED_SCORING_MIN_LEADS = 64
+
+# Extracted industry -> generation-friendly industry name
+_INDUSTRY_MAPPING = {
+    'technology': 'technology',
+    'healthcare': 'healthcare',
+    'finance': 'financial services',
+    'education': 'education',
+    'ecommerce': 'e-commerce',
+    'consulting': 'business consulting',
+    'real_estate': 'real estate',
+    'marketing': 'marketing and advertising',
+    'manufacturing': 'manufacturing',
+    'logistics': 'logistics and supply chain'
+}
+
 
 class ContextAwareLeadGenerator:
     """
@@ -20,8 +133,16 @@ class ContextAwareLeadGenerator:
     Uses extracted insights to tailor lead generation prompts and criteria.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[DiskCache] = None):
+        """
+        Initialize generator.
+        
+        Args:
+            cache: Optional cache for website analysis and insights
+                (defaults to a DiskCache under LEAD_CACHE_DIR)
+        """
         self.gemini_client = GeminiClient()
+        self.cache = cache if cache is not None else DiskCache()
     
     def generate_contextual_leads(
         self,
@@ -41,56 +162,340 @@ class ContextAwareLeadGenerator:
             Dictionary with generated leads and insights
         """
         try:
-            logger.info(f"Analyzing user website: {user_website_url}")
-            
-            # Step 1: Analyze website content
-            website_content = analyze_website_content(user_website_url)
-            
-            if not website_content:
-                raise Exception("Failed to analyze website content")
-            
-            # Step 2: Extract business insights
-            insights = extract_business_insights(website_content)
-            
-            logger.info(f"Extracted insights: {insights.get('industry', {}).get('primary', 'unknown')}")
+            # Steps 1-2: Analyze website content and extract business insights
+            website_content, insights = self._analyze_website(user_website_url)
             
             # Step 3: Generate tailored leads
             leads = self._generate_tailored_leads(insights, website_content, number_of_leads, target_country)
             
-            return {
-                'success': True,
-                'user_website': user_website_url,
-                'insights': insights,
-                'website_analysis': {
-                    'title': website_content.title,
-                    'description': website_content.description,
-                    'industry': insights.get('industry', {}).get('primary', 'unknown'),
-                    'value_proposition': insights.get('value_proposition', ''),
-                    'target_audience': insights.get('target_audience', {}).get('primary', 'general')
-                },
-                'leads': leads,
-                'generation_context': {
-                    'based_on_industry': insights.get('industry', {}).get('primary'),
-                    'target_audience': insights.get('target_audience', {}).get('primary'),
-                    'business_model': insights.get('business_model', ''),
-                    'geographic_focus': insights.get('geographic_focus', [])
-                }
-            }
+            return self._build_result(user_website_url, website_content, insights, leads)
             
         except Exception as e:
             logger.error(f"Error generating contextual leads: {str(e)}")
             raise Exception(f"Failed to generate contextual leads: {str(e)}")
     
-    def _generate_tailored_leads(
+    def generate_contextual_leads_batch(
+        self,
+        user_website_urls: List[str],
+        number_of_leads: int = 10,
+        target_country: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Generate leads for several websites.
+        
+        Synchronous wrapper around generate_contextual_leads_batch_async;
+        must not be called from inside a running event loop.
+        
+        Args:
+            user_website_urls: URLs of the user's business/product websites
+            number_of_leads: Number of leads to generate per website
+            target_country: Optional country filter
+        
+        Returns:
+            One result per URL, in order. Failed URLs get
+            {'success': False, 'user_website': url, 'error': message}.
+        """
+        return asyncio.run(
+            self.generate_contextual_leads_batch_async(user_website_urls, number_of_leads, target_country)
+        )
+    
+    async def generate_contextual_leads_batch_async(
+        self,
+        user_website_urls: List[str],
+        number_of_leads: int = 10,
+        target_country: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Generate leads for several websites concurrently.
+        
+        Websites are fetched and analyzed concurrently over one pooled
+        aiohttp session. With ENABLE_BATCH_MODE=1 all Gemini requests that
+        miss the semantic cache are then submitted as one Gemini Batch API
+        job (half price, but completes asynchronously); otherwise each
+        website's leads are generated in a worker thread, concurrently.
+        
+        Args:
+            user_website_urls: URLs of the user's business/product websites
+            number_of_leads: Number of leads to generate per website
+            target_country: Optional country filter
+        
+        Returns:
+            One result per URL, in order. Failed URLs get
+            {'success': False, 'user_website': url, 'error': message}.
+        """
+        results: List[Optional[Dict]] = [None] * len(user_website_urls)
+        analyzed = {}  # index -> (website_content, insights)
+        
+        # Steps 1-2: Analyze all websites concurrently
+        analyses = await self._analyze_websites_async(user_website_urls)
+        for i, (url, analysis) in enumerate(zip(user_website_urls, analyses)):
+            if isinstance(analysis, Exception):
+                logger.error(f"Error analyzing {url}: {str(analysis)}")
+                results[i] = {'success': False, 'user_website': url, 'error': str(analysis)}
+            else:
+                analyzed[i] = analysis
+        
+        # Step 3: Generate tailored leads
+        if os.getenv('ENABLE_BATCH_MODE', '0') == '1':
+            leads_by_index = await asyncio.to_thread(
+                self._generate_tailored_leads_batch, analyzed, number_of_leads, target_country
+            )
+        else:
+            semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+            
+            async def generate(i):
+                website_content, insights = analyzed[i]
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self._generate_tailored_leads, insights, website_content, number_of_leads, target_country
+                    )
+            
+            indices = list(analyzed)
+            generated = await asyncio.gather(*[generate(i) for i in indices], return_exceptions=True)
+            leads_by_index = dict(zip(indices, generated))
+        
+        for i, (website_content, insights) in analyzed.items():
+            url = user_website_urls[i]
+            leads = leads_by_index[i]
+            if isinstance(leads, Exception):
+                logger.error(f"Error generating contextual leads for {url}: {str(leads)}")
+                results[i] = {'success': False, 'user_website': url, 'error': str(leads)}
+            else:
+                results[i] = self._build_result(url, website_content, insights, leads)
+        
+        return results
+    
+    def _generate_tailored_leads_batch(
+        self,
+        analyzed: Dict[int, Tuple[WebsiteContent, Dict]],
+        number: int,
+        country: Optional[str]
+    ) -> Dict[int, object]:
+        """
+        Generate leads for several analyzed websites with one Gemini Batch API
+        job, serving semantic cache hits directly.
+        
+        Returns:
+            Mapping of index to enhanced leads, or to the Exception raised
+        """
+        prepared = {
+            i: self._prepare_generation(insights, website_content, number, country)
+            for i, (website_content, insights) in analyzed.items()
+        }
+        
+        # Serve what we can from the semantic cache, batch the rest
+        responses = {}
+        for i, (profile, resolved_country, industry) in prepared.items():
+            cached = self._lookup_semantic_cache(profile, resolved_country, industry, number)
+            if cached is not None:
+                responses[i] = cached
+        
+        pending = [i for i in prepared if i not in responses]
+        if pending:
+            jobs = [
+                {
+                    'industry': prepared[i][2],
+                    'number': number,
+                    'country': prepared[i][1]
+                }
+                for i in pending
+            ]
+            try:
+                batch_responses = self.gemini_client.generate_companies_batch(jobs)
+            except Exception as e:
+                logger.error(f"Gemini batch generation failed: {str(e)}")
+                batch_responses = [{'error': str(e)}] * len(pending)
+            
+            if len(batch_responses) != len(pending):
+                logger.warning(
+                    f"Gemini batch returned {len(batch_responses)} responses for {len(pending)} requests"
+                )
+                batch_responses = list(batch_responses[:len(pending)])
+                batch_responses += [
+                    {'error': 'Gemini batch returned no response for this request'}
+                ] * (len(pending) - len(batch_responses))
+            
+            semantic_cache = get_semantic_cache()
+            for i, response in zip(pending, batch_responses):
+                responses[i] = response
+                if semantic_cache:
+                    semantic_cache.add(*prepared[i], response)
+        
+        leads_by_index = {}
+        for i, response in responses.items():
+            if 'error' in response:
+                leads_by_index[i] = Exception(response['error'])
+            else:
+                website_content, insights = analyzed[i]
+                leads_by_index[i] = self._enhance_leads_with_context(
+                    response.get('companies', []), insights, website_content, top_k=number
+                )
+        return leads_by_index
+    
+    async def _analyze_websites_async(self, user_website_urls: List[str]) -> List:
+        """
+        Analyze several websites concurrently over one pooled session.
+        
+        Returns:
+            (website_content, insights) per URL, or the Exception raised
+        """
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=CONNECTION_POOL_SIZE)
+        
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def analyze(url):
+                async with semaphore:
+                    return await self._analyze_website_async(url, session)
+            
+            return await asyncio.gather(*[analyze(url) for url in user_website_urls], return_exceptions=True)
+    
+    async def _analyze_website_async(
+        self,
+        user_website_url: str,
+        session: aiohttp.ClientSession
+    ) -> Tuple[WebsiteContent, Dict]:
+        """
+        Async version of _analyze_website.
+        
+        Raises:
+            Exception: If the website could not be analyzed
+        """
+        logger.info(f"Analyzing user website: {user_website_url}")
+        
+        key = url_cache_key(user_website_url)
+        
+        previous = None
+        website_content = self.cache.get(f"wc:{key}")
+        if website_content is None:
+            previous = self.cache.get(f"site:{key}") or (None, None)
+            website_content = await analyze_website_content_async(user_website_url, session, previous[0])
+            
+            if not website_content:
+                raise Exception("Failed to analyze website content")
+            
+            self.cache.set(f"wc:{key}", website_content)
+        else:
+            logger.info(f"Using cached website analysis for {user_website_url}")
+        
+        # Insight extraction makes a blocking Gemini call; keep it off the
+        # event loop so the other websites in the batch proceed concurrently
+        insights = await asyncio.to_thread(self._get_insights, key, website_content, previous)
+        
+        return website_content, insights
+    
+    def _analyze_website(self, user_website_url: str) -> Tuple[WebsiteContent, Dict]:
+        """
+        Analyze a website and extract business insights, using the cache.
+        
+        Raises:
+            Exception: If the website could not be analyzed
+        """
+        logger.info(f"Analyzing user website: {user_website_url}")
+        
+        # Website analysis and insights are cached per normalized URL
+        key = url_cache_key(user_website_url)
+        
+        # Step 1: Analyze website content, revalidating the last analysis
+        # (if any) once the cached one has expired
+        previous = None
+        website_content = self.cache.get(f"wc:{key}")
+        if website_content is None:
+            previous = self.cache.get(f"site:{key}") or (None, None)
+            website_content = analyze_website_content(user_website_url, previous[0])
+            
+            if not website_content:
+                raise Exception("Failed to analyze website content")
+            
+            self.cache.set(f"wc:{key}", website_content)
+        else:
+            logger.info(f"Using cached website analysis for {user_website_url}")
+        
+        # Step 2: Extract business insights
+        insights = self._get_insights(key, website_content, previous)
+        
+        logger.info(f"Extracted insights: {insights.get('industry', {}).get('primary', 'unknown')}")
+        
+        return website_content, insights
+    
+    def _get_insights(
+        self,
+        key: str,
+        website_content: WebsiteContent,
+        previous: Optional[Tuple[Optional[WebsiteContent], Optional[Dict]]]
+    ) -> Dict:
+        """
+        Get business insights for analyzed website content, using the cache.
+        
+        Args:
+            key: URL cache key
+            website_content: Analyzed website content
+            previous: (content, insights) of the site's last analysis when
+                website_content was just fetched, or None if it came from
+                the cache. Insights are reused if the site is unchanged -
+                a 304 response or identical text.
+        
+        Returns:
+            Business insights
+        """
+        insights = self.cache.get(f"insights:{key}")
+        if insights is None:
+            previous_content, previous_insights = previous or (None, None)
+            if previous_insights is not None and (
+                website_content is previous_content
+                or website_content.text_content == previous_content.text_content
+            ):
+                logger.info(f"Website unchanged since last analysis, reusing insights for {website_content.url}")
+                insights = previous_insights
+            else:
+                insights = extract_business_insights(website_content)
+            self.cache.set(f"insights:{key}", insights)
+        
+        if previous is not None:
+            self.cache.set(f"site:{key}", (website_content, insights), expire=REVALIDATION_TTL)
+        
+        return insights
+    
+    def _build_result(
+        self,
+        user_website_url: str,
+        website_content: WebsiteContent,
+        insights: Dict,
+        leads: List[Dict]
+    ) -> Dict:
+        """Assemble the response for one analyzed website"""
+        return {
+            'success': True,
+            'user_website': user_website_url,
+            'insights': insights,
+            'website_analysis': {
+                'title': website_content.title,
+                'description': website_content.description,
+                'industry': insights.get('industry', {}).get('primary', 'unknown'),
+                'value_proposition': insights.get('value_proposition', ''),
+                'target_audience': insights.get('target_audience', {}).get('primary', 'general')
+            },
+            'leads': leads,
+            'generation_context': {
+                'based_on_industry': insights.get('industry', {}).get('primary'),
+                'target_audience': insights.get('target_audience', {}).get('primary'),
+                'business_model': insights.get('business_model', ''),
+                'geographic_focus': insights.get('geographic_focus', [])
+            }
+        }
+    
+    def _prepare_generation(
         self,
         insights: Dict,
         website_content,
         number: int,
         country: Optional[str]
-    ) -> List[Dict]:
-        """Generate leads tailored to business insights"""
+    ) -> Tuple[str, str, str]:
+        """
+        Resolve what to generate for a website.
         
-        # Build context-aware prompt
+        Returns:
+            (semantic cache profile, target country, industry to generate for)
+        """
         industry = insights.get('industry', {}).get('primary', 'general')
         target_audience = insights.get('target_audience', {}).get('primary', 'general')
         business_model = insights.get('business_model', '')
@@ -104,30 +509,57 @@ class ContextAwareLeadGenerator:
         if not country:
             country = "USA"  # Default
         
-        # Build tailored prompt
-        prompt = self._build_tailored_prompt(
+        profile = _CACHE_PROFILE.substitute(
             industry=industry,
             target_audience=target_audience,
             business_model=business_model,
-            offerings=offerings,
-            value_proposition=value_prop,
-            number=number,
-            country=country,
-            website_title=website_content.title
+            offerings=', '.join(offerings[:3]) if offerings else 'Various services',
+            value_proposition=value_prop[:200] if value_prop else 'Not specified'
         )
         
-        # Generate leads using Gemini
-        result = self.gemini_client.generate_companies(
-            industry=self._map_industry_for_generation(industry, insights),
-            number=number,
-            country=country
-        )
+        return profile, country, self._map_industry_for_generation(industry, insights)
+    
+    def _lookup_semantic_cache(self, profile: str, country: str, industry: str, number: int) -> Optional[Dict]:
+        """
+        Reuse a cached response for a near-identical business profile in the
+        same country and industry, or merge several similar ones. Returns
+        None on a miss or when the cache is disabled.
+        """
+        semantic_cache = get_semantic_cache()
+        if not semantic_cache:
+            return None
+        return semantic_cache.lookup(profile, country, industry, number)
+    
+    def _generate_tailored_leads(
+        self,
+        insights: Dict,
+        website_content,
+        number: int,
+        country: Optional[str]
+    ) -> List[Dict]:
+        """Generate leads tailored to business insights"""
+        profile, country, industry = self._prepare_generation(insights, website_content, number, country)
+        
+        # Try the semantic cache before falling back to Gemini
+        result = self._lookup_semantic_cache(profile, country, industry, number)
+        
+        if result is None:
+            # Generate leads using Gemini
+            result = self.gemini_client.generate_companies(
+                industry=industry,
+                number=number,
+                country=country
+            )
+            semantic_cache = get_semantic_cache()
+            if semantic_cache:
+                semantic_cache.add(profile, country, industry, result)
         
         # Enhance leads with context
         enhanced_leads = self._enhance_leads_with_context(
             result.get('companies', []),
             insights,
-            website_content
+            website_content,
+            top_k=number
         )
         
         return enhanced_leads
@@ -144,53 +576,28 @@ class ContextAwareLeadGenerator:
         website_title: str
     ) -> str:
         """Build a tailored prompt for lead generation"""
-        
-        prompt = f"""
-        Generate {number} highly relevant leads for a business that:
-        
-        Industry: {industry}
-        Target Audience: {target_audience}
-        Business Model: {business_model}
-        Key Offerings: {', '.join(offerings[:3]) if offerings else 'Various services'}
-        Value Proposition: {value_proposition[:200] if value_proposition else 'Not specified'}
-        
-        Focus on companies in {country} that would be ideal customers, partners, or prospects
-        for this business. Prioritize companies that:
-        1. Operate in complementary or related industries
-        2. Serve similar target audiences ({target_audience})
-        3. Could benefit from the offerings mentioned
-        4. Are in a position to engage (growth stage, expanding, etc.)
-        
-        Return comprehensive company information including contact details.
-        """
-        
-        return prompt
+        return _TAILORED_PROMPT.substitute(
+            number=number,
+            industry=industry,
+            target_audience=target_audience,
+            business_model=business_model,
+            offerings=', '.join(offerings[:3]) if offerings else 'Various services',
+            value_proposition=value_proposition[:200] if value_proposition else 'Not specified',
+            country=country
+        )
     
     def _map_industry_for_generation(self, industry: str, insights: Dict) -> str:
         """Map extracted industry to generation-friendly format"""
-        industry_mapping = {
-            'technology': 'technology',
-            'healthcare': 'healthcare',
-            'finance': 'financial services',
-            'education': 'education',
-            'ecommerce': 'e-commerce',
-            'consulting': 'business consulting',
-            'real_estate': 'real estate',
-            'marketing': 'marketing and advertising',
-            'manufacturing': 'manufacturing',
-            'logistics': 'logistics and supply chain'
-        }
-        
-        mapped = industry_mapping.get(industry, industry)
+        mapped = _INDUSTRY_MAPPING.get(industry, industry)
         
         # Add context from offerings if available
         offerings = insights.get('offerings', [])
         if offerings and len(offerings) > 0:
             # Try to extract more specific industry from first offering
-            first_offering = offerings[0].lower()
-            if 'saas' in first_offering or 'software' in first_offering:
+            offering_keywords = _KEYWORD_MATCHER.find_all(offerings[0].lower())
+            if 'saas' in offering_keywords or 'software' in offering_keywords:
                 mapped = 'SaaS companies'
-            elif 'fintech' in first_offering or 'payment' in first_offering:
+            elif 'fintech' in offering_keywords or 'payment' in offering_keywords:
                 mapped = 'fintech'
         
         return mapped
@@ -199,28 +606,47 @@ class ContextAwareLeadGenerator:
         self,
         leads: List[Dict],
         insights: Dict,
-        website_content
+        website_content,
+        top_k: Optional[int] = None
     ) -> List[Dict]:
-        """Enhance generated leads with context and relevance scoring"""
+        """
+        Enhance generated leads with context and relevance scoring.
+        
+        Args:
+            leads: Generated leads
+            insights: Business insights of the user's website
+            website_content: Analyzed website content
+            top_k: Only keep this many of the most relevant leads (all if None)
+        
+        Returns:
+            Enhanced leads, most relevant first
+        """
         
         industry = insights.get('industry', {}).get('primary', '')
         target_audience = insights.get('target_audience', {}).get('primary', '')
         business_model = insights.get('business_model', '')
         
+        relevance_scores = self._calculate_relevance_scores(leads, insights)
+        
+        # Tags depend only on the insights, so every lead shares one list
+        context_tags = self._generate_context_tags(insights)
+        
+        # Rank by relevance score before enhancing, so only kept leads are
+        # enhanced (stable: ties keep generation order)
+        if top_k is None:
+            top_k = len(leads)
+        ranked = heapq.nlargest(top_k, range(len(leads)), key=relevance_scores.__getitem__)
+        
         enhanced = []
-        for lead in leads:
-            # Add context relevance score
-            relevance_score = self._calculate_relevance_score(lead, insights)
-            
-            # Add context tags
-            context_tags = self._generate_context_tags(lead, insights)
+        for i in ranked:
+            lead = leads[i]
             
             # Add match reasoning
             match_reasoning = self._generate_match_reasoning(lead, insights, website_content)
             
             enhanced_lead = {
                 **lead,
-                'context_relevance_score': relevance_score,
+                'context_relevance_score': relevance_scores[i],
                 'context_tags': context_tags,
                 'match_reasoning': match_reasoning,
                 'generated_for_industry': industry,
@@ -229,50 +655,109 @@ class ContextAwareLeadGenerator:
             
             enhanced.append(enhanced_lead)
         
-        # Sort by relevance score
-        enhanced.sort(key=lambda x: x.get('context_relevance_score', 0), reverse=True)
-        
         return enhanced
     
-    def _calculate_relevance_score(self, lead: Dict, insights: Dict) -> int:
-        """Calculate how relevant a lead is to the user's business"""
-        score = 50  # Base score
+    def _calculate_relevance_scores(self, leads: List[Dict], insights: Dict) -> List[int]:
+        """
+        Calculate relevance scores for all leads.
+        
+        Large batches are scored with NumPy string operations over column
+        arrays; the result matches the _make_scorer scorer per lead.
+        """
+        if np is None or len(leads) < VECTORIZED_SCORING_MIN_LEADS:
+            return list(map(self._make_scorer(insights), leads))
+        
+        def column(field: str):
+            return np.array([(lead.get(field) or '').lower() for lead in leads], dtype=str)
         
-        # Industry match
+        lead_industries = column('key_products_services')
+        company_sizes = column('company_size')
+        scores = np.full(len(leads), 50, dtype=np.int64)
+        
+        # Industry match (either side may contain the other)
         user_industry = insights.get('industry', {}).get('primary', '').lower()
-        lead_industry = lead.get('key_products_services', '').lower()
-        if user_industry in lead_industry or lead_industry in user_industry:
-            score += 20
+        industry_match = (
+            (np.char.find(lead_industries, user_industry) >= 0)
+            | (np.char.find(np.full(len(leads), user_industry), lead_industries) >= 0)
+        )
+        scores += 20 * industry_match
         
         # Target audience match
         user_audience = insights.get('target_audience', {}).get('primary', '').lower()
         if user_audience in ['b2b', 'enterprise']:
-            # Prefer larger companies
-            company_size = lead.get('company_size', '').lower()
-            if '100+' in company_size or '1000+' in company_size:
-                score += 15
+            large = (np.char.find(company_sizes, '100+') >= 0) | (np.char.find(company_sizes, '1000+') >= 0)
+            scores += 15 * large
         elif user_audience in ['b2c', 'individual']:
-            # Prefer consumer-facing companies
-            target_market = lead.get('target_market', '').lower()
-            if 'consumer' in target_market or 'individual' in target_market:
-                score += 15
+            target_markets = column('target_market')
+            consumer = (np.char.find(target_markets, 'consumer') >= 0) | (np.char.find(target_markets, 'individual') >= 0)
+            scores += 15 * consumer
         
         # Geographic match
         user_geo = insights.get('geographic_focus', [])
         if user_geo:
-            lead_location = lead.get('headquarters_location', '').lower()
-            if any(country.lower() in lead_location for country in user_geo):
-                score += 10
+            geo_matches = _make_geo_matcher(user_geo)
+            geo_match = np.fromiter(
+                (geo_matches((lead.get('headquarters_location') or '').lower()) for lead in leads),
+                dtype=bool,
+                count=len(leads)
+            )
+            scores += 10 * geo_match
         
         # Company size relevance
-        company_size = lead.get('company_size', '')
-        if company_size:
-            if '100+' in company_size or '500+' in company_size:
+        size_bonus = (np.char.find(company_sizes, '100+') >= 0) | (np.char.find(company_sizes, '500+') >= 0)
+        scores += 5 * size_bonus
+        
+        return np.minimum(scores, 100).tolist()
+    
+    def _make_scorer(self, insights: Dict) -> Callable[[Dict], int]:
+        """
+        Build a function that calculates how relevant a lead is to the
+        user's business.
+        
+        The insights are fixed for a request, so they are read and
+        lowercased once here and captured by the returned scorer.
+        """
+        user_industry = insights.get('industry', {}).get('primary', '').lower()
+        user_audience = insights.get('target_audience', {}).get('primary', '').lower()
+        prefers_large = user_audience in ['b2b', 'enterprise']
+        prefers_consumer = user_audience in ['b2c', 'individual']
+        user_geo = insights.get('geographic_focus', [])
+        geo_matches = _make_geo_matcher(user_geo) if user_geo else None
+        
+        def score_lead(lead: Dict) -> int:
+            score = 50  # Base score
+            
+            # Industry match
+            lead_industry = (lead.get('key_products_services') or '').lower()
+            if user_industry in lead_industry or lead_industry in user_industry:
+                score += 20
+            
+            size_keywords = _KEYWORD_MATCHER.find_all((lead.get('company_size') or '').lower())
+            
+            # Target audience match
+            if prefers_large:
+                # Prefer larger companies
+                if '100+' in size_keywords or '1000+' in size_keywords:
+                    score += 15
+            elif prefers_consumer:
+                # Prefer consumer-facing companies
+                market_keywords = _KEYWORD_MATCHER.find_all((lead.get('target_market') or '').lower())
+                if 'consumer' in market_keywords or 'individual' in market_keywords:
+                    score += 15
+            
+            # Geographic match
+            if geo_matches and geo_matches((lead.get('headquarters_location') or '').lower()):
+                score += 10
+            
+            # Company size relevance
+            if '100+' in size_keywords or '500+' in size_keywords:
                 score += 5
+            
+            return min(100, score)
         
-        return min(100, score)
+        return score_lead
     
-    def _generate_context_tags(self, lead: Dict, insights: Dict) -> List[str]:
+    def _generate_context_tags(self, insights: Dict) -> List[str]:
         """Generate tags indicating why this lead is relevant"""
         tags = []
         
@@ -321,21 +806,40 @@ class ContextAwareLeadGenerator:
         if not target_audience or target_audience == 'general':
             return True
         
-        target_market = lead.get('target_market', '').lower()
-        company_size = lead.get('company_size', '').lower()
+        market_keywords = _KEYWORD_MATCHER.find_all((lead.get('target_market') or '').lower())
+        size_keywords = _KEYWORD_MATCHER.find_all((lead.get('company_size') or '').lower())
         
         if target_audience == 'enterprise':
-            return '1000+' in company_size or 'enterprise' in target_market
+            return '1000+' in size_keywords or 'enterprise' in market_keywords
         elif target_audience == 'sme':
-            return 'small' in target_market or '50+' in company_size
+            return 'small' in market_keywords or '50+' in size_keywords
         elif target_audience == 'b2b':
-            return 'b2b' in target_market or 'business' in target_market
+            return 'b2b' in market_keywords or 'business' in market_keywords
         elif target_audience == 'b2c':
-            return 'consumer' in target_market or 'individual' in target_market
+            return 'consumer' in market_keywords or 'individual' in market_keywords
         
         return True
 
 
+def to_json_bytes(result: Dict) -> bytes:
+    """
+    Encode a lead-generation result (or API payload wrapping one) as JSON.
+    
+    Uses orjson when installed, which encodes straight to bytes several
+    times faster than the json module. The fallback produces the same
+    compact UTF-8 output as FastAPI's default JSONResponse.
+    
+    Args:
+        result: JSON-compatible dictionary
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 def generate_leads_from_website(
     website_url: str,
     number: int = 10,
@@ -355,3 +859,45 @@ def generate_leads_from_website(
     generator = ContextAwareLeadGenerator()
     return generator.generate_contextual_leads(website_url, number, country)
 
+
+def generate_leads_from_websites(
+    website_urls: List[str],
+    number: int = 10,
+    country: Optional[str] = None
+) -> List[Dict]:
+    """
+    Convenience function to generate leads for several websites.
+    
+    Websites are analyzed concurrently; uses the Gemini Batch API when
+    ENABLE_BATCH_MODE=1.
+    
+    Args:
+        website_urls: User business website URLs
+        number: Number of leads to generate per website
+        country: Optional country filter
+    
+    Returns:
+        List of result dictionaries, one per URL
+    """
+    generator = ContextAwareLeadGenerator()
+    return generator.generate_contextual_leads_batch(website_urls, number, country)
+
+
+async def generate_leads_from_websites_async(
+    website_urls: List[str],
+    number: int = 10,
+    country: Optional[str] = None
+) -> List[Dict]:
+    """
+    Async convenience function to generate leads for several websites.
+    
+    Args:
+        website_urls: User business website URLs
+        number: Number of leads to generate per website
+        country: Optional country filter
+    
+    Returns:
+        List of result dictionaries, one per URL
+    """
+    generator = ContextAwareLeadGenerator()
+    return await generator.generate_contextual_leads_batch_async(website_urls, number, country)
@@ -0,0 +1,136 @@
+"""
+Disk Cache
+Small persistent key-value cache used to skip repeated website analysis
+and insight extraction for sites that were analyzed recently.
+"""
+
+import os
+import mmap
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv('LEAD_CACHE_DIR', './.lead_cache')
+DEFAULT_TTL = int(os.getenv('LEAD_CACHE_TTL', '86400'))  # 24 hours
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a website URL so equivalent spellings share a cache key.
+
+    Adds a missing scheme, lowercases scheme and host, and drops the
+    fragment and any trailing slash.
+    """
+    url = url.strip()
+    if not url.lower().startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+def url_cache_key(url: str) -> str:
+    """SHA-256 hex digest of the normalized URL"""
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+
+class DiskCache:
+    """
+    Pickle-backed cache stored as one file per key with an expiry time.
+
+    Safe to share between processes: writes go to a temp file that is
+    atomically renamed into place. Reads unpickle straight from a
+    memory-mapped view of the file instead of copying it into a buffer.
+    If the directory can't be created (e.g. a read-only filesystem) the
+    cache is disabled: get() always misses and set() does nothing.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, default_ttl: int = DEFAULT_TTL):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory holding the cache files
+            default_ttl: Seconds before an entry expires (0 means never)
+        """
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.enabled = True
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Disk cache disabled, cannot create {directory}: {str(e)}")
+            self.enabled = False
+
+    def _path(self, key: str) -> str:
+        """File path for a cache key"""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.pkl")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Returns:
+            The cached value, or None if missing, expired or unreadable
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                expires_at, value = pickle.loads(mm)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {str(e)}")
+            self.delete(key)
+            return None
+
+        if expires_at is not None and expires_at < time.time():
+            self.delete(key)
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Any picklable object
+            expire: Seconds until expiry (defaults to default_ttl, 0 means never)
+        """
+        if not self.enabled:
+            return
+
+        ttl = self.default_ttl if expire is None else expire
+        expires_at = time.time() + ttl if ttl else None
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((expires_at, value), f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {key}: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def delete(self, key: str) -> None:
+        """Remove a cached value if present"""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
@@ -3,27 +3,50 @@ Email Sender Service
 Supports multiple sending methods:
 1. SendGrid (Recommended - allows custom sender emails)
 2. Yagmail with Reply-To (Fallback method)
+
+AsyncSendGridEmailSender provides pooled, concurrent SendGrid sends for
+bulk campaigns.
 """
 
 import os
+import base64
+import asyncio
+import logging
+import itertools
+import threading
+import mimetypes
+import traceback
 import yagmail
 from typing import List, Union
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# SendGrid accepts at most 1000 personalizations per request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
 
 class SendGridEmailSender:
     """SendGrid email sender - allows sending from any verified email"""
     def __init__(self):
         try:
             from sendgrid import SendGridAPIClient
-            from sendgrid.helpers.mail import Mail, Email, To, Content
+            from sendgrid.helpers.mail import (
+                Mail, Email, To, Content, Cc, Bcc, Attachment,
+                Personalization, Substitution
+            )
             self.SendGridAPIClient = SendGridAPIClient
             self.Mail = Mail
             self.Email = Email
             self.To = To
             self.Content = Content
+            self.Cc = Cc
+            self.Bcc = Bcc
+            self.Attachment = Attachment
+            self.Personalization = Personalization
+            self.Substitution = Substitution
         except ImportError:
             raise ImportError("SendGrid not installed. Run: pip install sendgrid")
         
@@ -44,8 +67,6 @@ class SendGridEmailSender:
     ) -> bool:
         """Send email via SendGrid from any verified email"""
         try:
-            from sendgrid.helpers.mail import Cc
-            
             message = self.Mail(
                 from_email=self.Email(from_email),
                 to_emails=self.To(to_email),
@@ -55,21 +76,204 @@ class SendGridEmailSender:
             
             # Add CC if provided
             if cc_email:
-                message.add_cc(Cc(cc_email))
-                print(f"📧 CC: {cc_email}")
+                message.add_cc(self.Cc(cc_email))
+                logger.debug("CC: %s", cc_email)
             
             response = self.client.send(message)
-            print(f"✅ SendGrid: Email sent to {to_email} from {from_email}")
+            logger.info("SendGrid: Email sent to %s from %s", to_email, from_email)
             if cc_email:
-                print(f"   CC sent to: {cc_email}")
+                logger.info("CC sent to: %s", cc_email)
             return True
         except Exception as e:
             error_msg = f"SendGrid failed: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             # Log more details for debugging
-            import traceback
-            print(f"Full traceback: {traceback.format_exc()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full traceback: %s", traceback.format_exc())
             raise Exception(error_msg)  # Raise instead of returning False
+    
+    def send_bulk(
+        self,
+        from_email: str,
+        recipients: List[dict],
+        subject_template: str,
+        html_template: str,
+        template_id: str = None
+    ) -> dict:
+        """
+        Send one templated email to many recipients using SendGrid
+        personalizations - up to 1000 recipients per API request instead
+        of one request each.
+        
+        Args:
+            from_email: Verified sender email
+            recipients: List of {'email': str, 'vars': dict} entries
+            subject_template: Subject; {{key}} placeholders are replaced per recipient
+            html_template: HTML body; {{key}} placeholders are replaced per recipient
+            template_id: Optional SendGrid dynamic template ID. When given,
+                each recipient's vars are sent as dynamic_template_data and
+                the template's own subject/body are used.
+        
+        Returns:
+            dict: {recipients: int, requests: int}
+        """
+        recipient_iter = iter(recipients)
+        sent = 0
+        requests_made = 0
+        try:
+            while True:
+                chunk = list(itertools.islice(recipient_iter, SENDGRID_MAX_PERSONALIZATIONS))
+                if not chunk:
+                    break
+                
+                message = self.Mail(
+                    from_email=self.Email(from_email),
+                    subject=subject_template,
+                    html_content=self.Content("text/html", html_template)
+                )
+                if template_id:
+                    message.template_id = template_id
+                
+                for recipient in chunk:
+                    personalization = self.Personalization()
+                    personalization.add_to(self.To(recipient['email']))
+                    variables = recipient.get('vars', {})
+                    if template_id:
+                        personalization.dynamic_template_data = variables
+                    else:
+                        for key, value in variables.items():
+                            personalization.add_substitution(self.Substitution(f"{{{{{key}}}}}", str(value)))
+                    message.add_personalization(personalization)
+                
+                self.client.send(message)
+                sent += len(chunk)
+                requests_made += 1
+                logger.info("SendGrid: Bulk email sent to %d recipients from %s", len(chunk), from_email)
+        except Exception as e:
+            error_msg = f"SendGrid bulk send failed after {sent} recipients: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        
+        return {'recipients': sent, 'requests': requests_made}
+
+
+def _sendgrid_attachment(path: str) -> dict:
+    """Read a file into a SendGrid v3 attachment object (base64 content)"""
+    with open(path, 'rb') as f:
+        content = base64.b64encode(f.read()).decode('ascii')
+    return {
+        'content': content,
+        'filename': os.path.basename(path),
+        'type': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+        'disposition': 'attachment'
+    }
+
+
+class AsyncSendGridEmailSender:
+    """
+    Async SendGrid sender for bulk campaigns.
+    
+    Posts directly to the /v3/mail/send REST endpoint over one pooled
+    HTTP/2 httpx.AsyncClient, so concurrent sends share keep-alive
+    connections instead of paying a TLS handshake each. Create it once
+    per event loop and reuse it; call aclose() when done.
+    """
+    API_URL = "https://api.sendgrid.com/v3/mail/send"
+    
+    def __init__(self, max_connections: int = 50, max_keepalive_connections: int = 20):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("httpx not installed. Run: pip install 'httpx[http2]'")
+        
+        self.api_key = os.getenv('SENDGRID_API_KEY', '')
+        if not self.api_key:
+            raise ValueError("Please set SENDGRID_API_KEY in .env file")
+        
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers={'Authorization': f'Bearer {self.api_key}'},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=30
+        )
+    
+    async def send_email(
+        self,
+        from_email: str,
+        to_email: Union[str, List[str]],
+        subject: str,
+        contents: str,
+        attachments: List[str] = None,
+        cc_email: str = None
+    ) -> bool:
+        """Send email via the SendGrid REST API from any verified email"""
+        recipients = [to_email] if isinstance(to_email, str) else to_email
+        personalization = {'to': [{'email': email} for email in recipients]}
+        if cc_email:
+            personalization['cc'] = [{'email': cc_email}]
+        
+        payload = {
+            'personalizations': [personalization],
+            'from': {'email': from_email},
+            'subject': subject,
+            'content': [{'type': 'text/html', 'value': contents}]
+        }
+        
+        try:
+            if attachments:
+                # File reads block, so keep them off the event loop
+                payload['attachments'] = await asyncio.to_thread(
+                    lambda: [_sendgrid_attachment(path) for path in attachments]
+                )
+            
+            response = await self.client.post(self.API_URL, json=payload)
+            response.raise_for_status()
+            logger.info("SendGrid: Email sent to %s from %s", to_email, from_email)
+            return True
+        except Exception as e:
+            error_msg = f"SendGrid failed: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+    
+    async def send_bulk(self, messages: List[dict]) -> List[dict]:
+        """
+        Send many emails concurrently over the shared connection pool.
+        
+        Args:
+            messages: List of send_email keyword-argument dicts
+        
+        Returns:
+            list: One {success, method, message, from, to, cc} dict per message
+        """
+        results = await asyncio.gather(
+            *[self.send_email(**message) for message in messages],
+            return_exceptions=True
+        )
+        
+        return [
+            {
+                "success": not isinstance(result, Exception),
+                "method": "sendgrid",
+                "message": str(result) if isinstance(result, Exception) else "Email sent successfully via sendgrid",
+                "from": message.get('from_email'),
+                "to": message.get('to_email'),
+                "cc": message.get('cc_email')
+            }
+            for message, result in zip(messages, results)
+        ]
+    
+    async def aclose(self):
+        """Close the underlying HTTP connection pool"""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
 
 class YagmailEmailSender:
@@ -96,7 +300,7 @@ class YagmailEmailSender:
                 smtp_starttls=False,
                 smtp_ssl=True
             )
-            print(f"📧 Yagmail configured: {smtp_server}:465 (SSL)")
+            logger.info("Yagmail configured: %s:465 (SSL)", smtp_server)
         elif smtp_port == 587:
             # Use STARTTLS on port 587 (works locally, may be blocked on cloud)
             self.yag = yagmail.SMTP(
@@ -107,8 +311,8 @@ class YagmailEmailSender:
                 smtp_starttls=True,
                 smtp_ssl=False
             )
-            print(f"⚠️  Yagmail configured: {smtp_server}:587 (STARTTLS)")
-            print(f"⚠️  Note: Port 587 may be blocked on cloud providers like Render.com")
+            logger.warning("Yagmail configured: %s:587 (STARTTLS)", smtp_server)
+            logger.warning("Note: Port 587 may be blocked on cloud providers like Render.com")
         else:
             # Custom port
             self.yag = yagmail.SMTP(
@@ -117,7 +321,7 @@ class YagmailEmailSender:
                 host=smtp_server,
                 port=smtp_port
             )
-            print(f"📧 Yagmail configured: {smtp_server}:{smtp_port}")
+            logger.info("Yagmail configured: %s:%s", smtp_server, smtp_port)
     
     def send_email(
         self,
@@ -151,7 +355,7 @@ class YagmailEmailSender:
             cc_list = None
             if cc_email:
                 cc_list = [cc_email] if isinstance(cc_email, str) else cc_email
-                print(f"📧 CC: {cc_email}")
+                logger.debug("CC: %s", cc_email)
             
             self.yag.send(
                 to=to_email,
@@ -162,17 +366,17 @@ class YagmailEmailSender:
                 cc=cc_list
             )
             
-            print(f"✅ Yagmail: Email sent to {to_email} (on behalf of {from_email})")
+            logger.info("Yagmail: Email sent to %s (on behalf of %s)", to_email, from_email)
             if cc_email:
-                print(f"   CC sent to: {cc_email}")
-            print(f"   Note: Replies will go to {from_email}")
+                logger.info("CC sent to: %s", cc_email)
+            logger.debug("Note: Replies will go to %s", from_email)
             return True
         except Exception as e:
             error_msg = f"Yagmail failed: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             # Log more details for debugging
-            import traceback
-            print(f"Full traceback: {traceback.format_exc()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full traceback: %s", traceback.format_exc())
             raise Exception(error_msg)  # Raise instead of returning False
 
 
@@ -190,14 +394,14 @@ class EmailSender:
         try:
             self.sender = SendGridEmailSender()
             self.method = "sendgrid"
-            print("✅ Email Service: SendGrid (sends from user's actual email)")
+            logger.info("Email Service: SendGrid (sends from user's actual email)")
         except (ImportError, ValueError) as e:
             # Fall back to Yagmail
             try:
                 self.sender = YagmailEmailSender()
                 self.method = "yagmail"
-                print("✅ Email Service: Yagmail (uses Reply-To header)")
-                print("   💡 Tip: For production, use SendGrid to send from actual user emails")
+                logger.info("Email Service: Yagmail (uses Reply-To header)")
+                logger.info("Tip: For production, use SendGrid to send from actual user emails")
             except ValueError:
                 raise ValueError(
                     "❌ No email service configured!\n\n"
@@ -272,12 +476,16 @@ class EmailSender:
             }
 
 
-# Singleton instance
+# Singleton instance (shared across worker threads, so its SendGrid client
+# and connections are reused)
 _email_sender = None
+_email_sender_lock = threading.Lock()
 
 def get_email_sender():
     """Get or create email sender singleton"""
     global _email_sender
     if _email_sender is None:
-        _email_sender = EmailSender()
+        with _email_sender_lock:
+            if _email_sender is None:
+                _email_sender = EmailSender()
     return _email_sender
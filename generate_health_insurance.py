@@ -2,6 +2,7 @@ import os
 import json
 import time
 import logging
+from typing import Dict, List
 from openai import OpenAI, APIError, APIConnectionError, RateLimitError
 from dotenv import load_dotenv
 
@@ -9,16 +10,77 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+MODEL = "gemini-2.5-flash"
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+# Gemini Batch API polling
+BATCH_POLL_INTERVAL = 30  # Seconds
+BATCH_TIMEOUT = 24 * 3600  # Seconds
+BATCH_DONE_STATES = ('JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED')
+
+# Invariant instructions shared by every generate_companies call. They lead
+# every request so Gemini's implicit prefix caching can reuse them; at about
+# 550 tokens they are below the minimum for an explicit context cache
+STATIC_PREAMBLE = """You are a professional lead generation expert. You generate comprehensive lists of companies for a given industry and country.
+
+**IMPORTANT: You must return your response as a valid JSON object only. Do not include any markdown formatting, code blocks, or additional text outside the JSON.**
+
+Return a JSON object with this structure:
+{
+    "companies": [
+        {
+            "company_name": "Official company name",
+            "website_url": "Official website link",
+            "company_size": "Number of employees (approximate range)",
+            "headquarters_location": "City and Country",
+            "revenue_market_cap": "Annual revenue or market capitalization",
+            "key_products_services": "Main offerings relevant to the industry",
+            "target_market": "Primary customer segments they serve",
+            "number_of_users": "Total number of users/members/customers/subscribers",
+            "notable_customers": ["Customer 1", "Customer 2", "Customer 3"] or null,
+            "social_media": {
+                "linkedin": "LinkedIn company page URL",
+                "twitter": "Twitter/X profile URL",
+                "facebook": "Facebook page URL",
+                "instagram": "Instagram profile URL",
+                "youtube": "YouTube channel URL"
+            },
+            "contact_email": "General contact email",
+            "recent_news_insights": "Recent developments, partnerships, or notable information",
+            "decision_maker_roles": ["CEO", "CFO", "VP of Sales", "etc."]
+        }
+    ]
+}
+
+Focus on providing accurate, up-to-date information that would be valuable for business development and lead generation purposes.
+
+**CRITICAL: If any information is not publicly available or cannot be found, set that field to null (not the string "Not publicly available", but the JSON null value).**
+
+For "number_of_users", include the total number of users, members, customers, or subscribers the company serves. Use the most recent publicly available data with approximate numbers if exact figures aren't available (e.g., "50 million members", "2.5 million customers"). If not available, set to null.
+
+For "notable_customers", include a list of known clients, customers, or partners if publicly available. If not available, set to null.
+
+For "social_media", provide the official URLs for each platform (LinkedIn, Twitter/X, Facebook, Instagram, YouTube). Set individual platforms to null if not found. Include the full URL for each platform.
+
+Remember: Return ONLY the JSON object, no additional text or formatting.
+"""
+
+
 class GeminiClient:
     def __init__(self):
         # Gemini's OpenAI-compatible endpoint
-        base_url = "https://generativelanguage.googleapis.com/v1beta/openai/"
+        base_url = f"{GEMINI_API_BASE}/openai/"
         
+        self.api_key = os.getenv('GEMINI_API_KEY')
         self.client = OpenAI(
-            api_key=os.getenv('GEMINI_API_KEY'),
+            api_key=self.api_key,
             base_url=base_url
         )
     
+    def _task_prompt(self, industry: str, number: int, country: str) -> str:
+        """Variable part of a generate_companies request"""
+        return f"Generate a comprehensive list of {number} companies in the {industry} industry that are based in or operate in {country}."
+    
     def generate_companies(self, industry, number, country, max_retries=5, initial_delay=2):
         """
         Generate companies with automatic retry logic for 503 errors.
@@ -36,63 +98,22 @@ class GeminiClient:
         Raises:
             Exception: If all retries are exhausted
         """
-        prompt = f"""
-        You are a professional lead generation expert. Generate a comprehensive list of {number} companies in the {industry} industry that are based in or operate in {country}.
-        
-        **IMPORTANT: You must return your response as a valid JSON object only. Do not include any markdown formatting, code blocks, or additional text outside the JSON.**
-        
-        Return a JSON object with this structure:
-        {{
-            "companies": [
-                {{
-                    "company_name": "Official company name",
-                    "website_url": "Official website link",
-                    "company_size": "Number of employees (approximate range)",
-                    "headquarters_location": "City and Country",
-                    "revenue_market_cap": "Annual revenue or market capitalization",
-                    "key_products_services": "Main offerings relevant to the industry",
-                    "target_market": "Primary customer segments they serve",
-                    "number_of_users": "Total number of users/members/customers/subscribers",
-                    "notable_customers": ["Customer 1", "Customer 2", "Customer 3"] or null,
-                    "social_media": {{
-                        "linkedin": "LinkedIn company page URL",
-                        "twitter": "Twitter/X profile URL",
-                        "facebook": "Facebook page URL",
-                        "instagram": "Instagram profile URL",
-                        "youtube": "YouTube channel URL"
-                    }},
-                    "contact_email": "General contact email",
-                    "recent_news_insights": "Recent developments, partnerships, or notable information",
-                    "decision_maker_roles": ["CEO", "CFO", "VP of Sales", "etc."]
-                }}
-            ]
-        }}
-        
-        Focus on providing accurate, up-to-date information that would be valuable for business development and lead generation purposes.
-        
-        **CRITICAL: If any information is not publicly available or cannot be found, set that field to null (not the string "Not publicly available", but the JSON null value).**
-        
-        For "number_of_users", include the total number of users, members, customers, or subscribers the company serves. Use the most recent publicly available data with approximate numbers if exact figures aren't available (e.g., "50 million members", "2.5 million customers"). If not available, set to null.
-        
-        For "notable_customers", include a list of known clients, customers, or partners if publicly available. If not available, set to null.
-        
-        For "social_media", provide the official URLs for each platform (LinkedIn, Twitter/X, Facebook, Instagram, YouTube). Set individual platforms to null if not found. Include the full URL for each platform.
-        
-        Remember: Return ONLY the JSON object, no additional text or formatting.
-        """
+        prompt = self._task_prompt(industry, number, country)
+        
+        # The static instructions lead the request and only the short task
+        # line varies between calls
+        messages = [
+            {"role": "system", "content": STATIC_PREAMBLE},
+            {"role": "user", "content": prompt}
+        ]
         
         last_exception = None
         
         for attempt in range(max_retries):
             try:
                 response = self.client.chat.completions.create(
-                    model="gemini-2.5-flash",
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
+                    model=MODEL,
+                    messages=messages
                 )
                 
                 # Success - break out of retry loop
@@ -176,8 +197,10 @@ class GeminiClient:
             # This shouldn't happen, but just in case
             raise Exception(f"Failed to get response after {max_retries} attempts")
         
-        response_text = response.choices[0].message.content
-        
+        return self._parse_response(response.choices[0].message.content)
+    
+    def _parse_response(self, response_text: str) -> Dict:
+        """Parse a companies JSON response, tolerating markdown code fences"""
         # Clean up the response if it contains markdown code blocks
         if "```json" in response_text:
             response_text = response_text.split("```json")[1].split("```")[0].strip()
@@ -192,6 +215,72 @@ class GeminiClient:
             print(f"Error parsing JSON: {e}")
             print(f"Raw response: {response_text}")
             return {"error": "Failed to parse response", "raw_response": response_text}
+    
+    def generate_companies_batch(
+        self,
+        jobs: List[Dict],
+        poll_interval: int = BATCH_POLL_INTERVAL,
+        timeout: int = BATCH_TIMEOUT
+    ) -> List[Dict]:
+        """
+        Generate companies for several requests in one Gemini Batch API job.
+        
+        Batch jobs are billed at half the interactive price but complete
+        asynchronously (minutes, up to 24h), so this blocks while polling.
+        Requires the google-genai package.
+        
+        Args:
+            jobs: List of {'industry', 'number', 'country'} dicts
+            poll_interval: Seconds between job status checks
+            timeout: Maximum seconds to wait for the job
+        
+        Returns:
+            One response per job, in order (same shape as generate_companies;
+            failed entries are {"error": ...} dicts)
+        
+        Raises:
+            ImportError: If google-genai is not installed
+            Exception: If the batch job fails, expires or times out
+        """
+        from google import genai
+        
+        client = genai.Client(api_key=self.api_key)
+        inline_requests = [
+            {
+                'contents': [{
+                    'role': 'user',
+                    'parts': [{'text': self._task_prompt(job['industry'], job['number'], job['country'])}]
+                }],
+                'config': {'system_instruction': {'parts': [{'text': STATIC_PREAMBLE}]}}
+            }
+            for job in jobs
+        ]
+        
+        batch_job = client.batches.create(
+            model=f"models/{MODEL}",
+            src=inline_requests,
+            config={'display_name': 'leadgen'}
+        )
+        logger.info(f"Submitted Gemini batch job {batch_job.name} with {len(jobs)} requests")
+        
+        deadline = time.time() + timeout
+        while batch_job.state.name not in BATCH_DONE_STATES:
+            if time.time() > deadline:
+                raise Exception(f"Gemini batch job {batch_job.name} timed out after {timeout}s")
+            time.sleep(poll_interval)
+            batch_job = client.batches.get(name=batch_job.name)
+        
+        if batch_job.state.name != 'JOB_STATE_SUCCEEDED':
+            raise Exception(f"Gemini batch job {batch_job.name} ended in state {batch_job.state.name}")
+        
+        # Inline responses come back in request order
+        results = []
+        for inline_response in batch_job.dest.inlined_responses:
+            if inline_response.response:
+                results.append(self._parse_response(inline_response.response.text))
+            else:
+                results.append({"error": str(inline_response.error)})
+        return results
 
 if __name__ == '__main__':
     # Input parameters
@@ -0,0 +1,143 @@
+"""
+HTTP Session
+Pooled requests sessions shared by the scrapers, so pages on the same host
+reuse keep-alive connections instead of a new TCP+TLS handshake each, and
+size-capped body reads so oversized pages don't bloat memory and parse time.
+
+Sessions can optionally keep an on-disk HTTP response cache (requires the
+requests-cache package), so re-running the pipeline on the same company
+list doesn't re-download pages fetched within the last SCRAPE_CACHE_TTL.
+"""
+
+import os
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from disk_cache import DEFAULT_CACHE_DIR
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+POOL_CONNECTIONS = 32  # Hosts kept in the pool
+POOL_MAXSIZE = 64  # Open connections kept per host
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Pages are truncated after this many (decompressed) bytes; anything past it
+# is almost always inline assets rather than contact details or copy
+MAX_PAGE_BYTES = 2_000_000
+CHUNK_SIZE = 65536
+
+# Links with these extensions are downloads, not pages worth scraping
+NON_HTML_EXTENSIONS = (
+    '.pdf', '.zip', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.mp3', '.mp4', '.mov'
+)
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+
+# SQLite response cache used by create_session(cached=True)
+SCRAPE_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'http_responses')
+SCRAPE_CACHE_TTL = int(os.getenv('SCRAPE_CACHE_TTL', '3600'))
+
+
+def create_session(headers: Dict[str, str], retries: int = 2, cached: bool = False) -> requests.Session:
+    """
+    Create a session with connection pooling and retries.
+
+    Args:
+        headers: Default headers sent with every request
+        retries: Retries on connection errors and RETRY_STATUSES responses
+        cached: Serve repeated GET requests from the SQLite response
+            cache at SCRAPE_CACHE_PATH. Ignored when requests-cache is not
+            installed or SCRAPE_CACHE_TTL is 0.
+
+    Returns:
+        Configured requests.Session (close it when done)
+    """
+    session = _new_session(cached)
+    session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=retries, backoff_factor=0.2, status_forcelist=RETRY_STATUSES)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _new_session(cached: bool) -> requests.Session:
+    """Plain session, or a requests-cache CachedSession when caching is available"""
+    if not (cached and requests_cache is not None and SCRAPE_CACHE_TTL > 0):
+        return requests.Session()
+
+    os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+    return requests_cache.CachedSession(
+        SCRAPE_CACHE_PATH,
+        backend='sqlite',
+        expire_after=SCRAPE_CACHE_TTL,
+        allowable_methods=('GET',),
+        allowable_codes=(200,),
+        filter_fn=_is_cacheable
+    )
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    """
+    Whether the response cache may store a response.
+
+    Storing reads the whole body, which would bypass read_capped and the
+    non-HTML checks, so only HTML with a Content-Length within
+    MAX_PAGE_BYTES is cached. Everything else is passed through unread.
+    """
+    if not is_html_content_type(response.headers.get('Content-Type')):
+        return False
+    try:
+        return int(response.headers['Content-Length']) <= MAX_PAGE_BYTES
+    except (KeyError, ValueError):
+        return False  # Unknown size (e.g. chunked): can't bound the read
+
+
+def is_page_url(url: str) -> bool:
+    """Whether a URL may be an HTML page (its path has no download extension)"""
+    return not urlsplit(url).path.lower().endswith(NON_HTML_EXTENSIONS)
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header denotes HTML (a missing header is given the benefit of the doubt)"""
+    return not content_type or content_type.lower().startswith(HTML_CONTENT_TYPES)
+
+
+def read_capped(response: requests.Response, max_bytes: int = MAX_PAGE_BYTES) -> bytes:
+    """
+    Read a streamed (stream=True) response body, stopping after max_bytes.
+
+    The cap may be exceeded by less than one chunk.
+    """
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= max_bytes:
+            break
+    return b''.join(chunks)
+
+
+async def read_capped_async(response: aiohttp.ClientResponse, max_bytes: int = MAX_PAGE_BYTES) -> bytes:
+    """Async version of read_capped for aiohttp responses"""
+    chunks = []
+    total = 0
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= max_bytes:
+            break
+    return b''.join(chunks)
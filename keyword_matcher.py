@@ -0,0 +1,53 @@
+"""
+Keyword Matcher
+Finds which of a fixed set of keywords occur in a string with one
+Aho-Corasick pass, instead of one substring scan per keyword.
+
+Uses the optional pyahocorasick package; without it matching falls back to
+plain substring checks with the same results.
+"""
+
+from typing import Iterable, Set
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Matcher over a fixed keyword set, built once and safe to share between
+    threads. Matching is case-sensitive; lowercase keywords and text.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Initialize matcher.
+
+        Args:
+            keywords: Keywords to look for
+        """
+        self.keywords = tuple(keywords)
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+
+    def search(self, text: str) -> bool:
+        """Whether any keyword occurs in text"""
+        if not text:
+            return False
+        if self.automaton is not None:
+            return next(self.automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self.keywords)
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the keywords occurring in text"""
+        if not text:
+            return set()
+        if self.automaton is not None:
+            return {keyword for _, keyword in self.automaton.iter(text)}
+        return {keyword for keyword in self.keywords if keyword in text}
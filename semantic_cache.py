@@ -0,0 +1,235 @@
+"""
+Semantic Prompt Cache
+Reuses Gemini lead-generation responses for businesses whose profiles are
+near-identical in meaning (e.g. two websites in the same industry and
+market), skipping the LLM round-trip.
+
+Requires the optional sentence-transformers and faiss packages; when they
+are missing the cache is simply disabled.
+"""
+
+import os
+import uuid
+import pickle
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from disk_cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+DEFAULT_THRESHOLD = 0.92
+
+# Generative caching: merge several partially similar responses when no
+# single one is close enough but together they cover the prompt
+COMBINE_SINGLE_THRESHOLD = 0.85
+COMBINE_TOTAL_THRESHOLD = 1.4
+COMBINE_K = 10
+
+
+class SemanticPromptCache:
+    """
+    Cache of lead-generation responses indexed by business profile embedding.
+
+    Profiles (the variable part of a request: industry, audience, offerings,
+    ...) are embedded with a sentence-transformers model and stored in
+    FAISS inner-product indexes over normalized vectors, so search scores
+    are cosine similarities. Entries are only reused for the same country
+    and the same generation industry, since that is what Gemini was asked
+    for, so each (country, industry) pair gets its own index: searches only
+    rank entries that could be reused.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        model_name: str = DEFAULT_MODEL,
+        threshold: float = DEFAULT_THRESHOLD
+    ):
+        """
+        Initialize cache, loading any entries persisted in directory.
+
+        Args:
+            directory: Directory holding the stored responses
+            model_name: sentence-transformers model used to embed prompts
+            threshold: Minimum profile cosine similarity for a cache hit
+
+        Raises:
+            ImportError: If sentence-transformers or faiss is not installed
+        """
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self.faiss = faiss
+        self.model = SentenceTransformer(model_name)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.threshold = threshold
+        self.lock = threading.Lock()
+
+        # (country, industry) -> index, and the entries in index order
+        self.indexes: Dict[Tuple[str, str], object] = {}
+        self.groups: Dict[Tuple[str, str], List[Dict]] = {}
+
+        # One file per entry, written atomically: adds never rewrite other
+        # entries, so a crash can only lose the entry being written and
+        # processes sharing the directory don't overwrite each other.
+        # Entries carry their embeddings; the per-group indexes are rebuilt on load
+        self.entries_dir = os.path.join(directory, 'semantic_leads')
+        os.makedirs(self.entries_dir, exist_ok=True)
+        for name in sorted(os.listdir(self.entries_dir)):
+            if not name.endswith('.pkl'):
+                continue
+            try:
+                with open(os.path.join(self.entries_dir, name), 'rb') as f:
+                    self._insert(pickle.load(f))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable semantic cache entry {name}: {str(e)}")
+
+    def _insert(self, entry: Dict) -> None:
+        """Add an entry to its (country, industry) group's index"""
+        key = (entry['country'], entry['industry'])
+        if key not in self.indexes:
+            self.indexes[key] = self.faiss.IndexFlatIP(self.dimension)
+            self.groups[key] = []
+        self.indexes[key].add(entry['embedding'])
+        self.groups[key].append(entry)
+
+    def _embed(self, profile: str):
+        """Normalized float32 embedding of a profile, shaped (1, dim)"""
+        return self.model.encode([profile], normalize_embeddings=True).astype('float32')
+
+    def search(self, profile: str, country: str, industry: str, k: int = 3) -> List[Tuple[float, Dict]]:
+        """
+        Find cached responses for similar profiles with the same country and industry.
+
+        Args:
+            profile: Business profile text (variable request fields only)
+            country: Target country the response must match
+            industry: Generation industry the response must match
+            k: Number of nearest profiles to consider
+
+        Returns:
+            List of (similarity, response) pairs, most similar first
+        """
+        key = (country, industry)
+        if key not in self.groups:
+            return []
+
+        embedding = self._embed(profile)
+        with self.lock:
+            entries = self.groups[key]
+            scores, ids = self.indexes[key].search(embedding, min(k, len(entries)))
+            return [
+                (float(score), entries[i]['response'])
+                for score, i in zip(scores[0], ids[0])
+                if i >= 0
+            ]
+
+    def lookup(self, profile: str, country: str, industry: str, number: int) -> Optional[Dict]:
+        """
+        Get a cached response for this profile: a single response similar
+        enough to reuse, or else several similar ones merged.
+
+        The profile is embedded and searched once; both strategies share
+        the COMBINE_K nearest results.
+
+        Returns:
+            Response with `number` companies, or None on a miss
+        """
+        similar = self.search(profile, country, industry, COMBINE_K)
+        return self._get(similar, number) or self._combine(similar, number)
+
+    def _get(self, similar: List[Tuple[float, Dict]], number: int) -> Optional[Dict]:
+        """Reuse the most similar response that is close enough and large enough"""
+        for score, response in similar:
+            companies = response.get('companies', [])
+            if score > self.threshold and len(companies) >= number:
+                logger.info(f"Semantic cache hit (similarity {score:.3f})")
+                return {**response, 'companies': companies[:number]}
+        return None
+
+    def _combine(self, similar: List[Tuple[float, Dict]], number: int) -> Optional[Dict]:
+        """
+        Synthesize a response from several similar cached responses.
+
+        Responses whose profiles score above COMBINE_SINGLE_THRESHOLD are
+        merged when their similarities sum above COMBINE_TOTAL_THRESHOLD.
+        Companies are de-duplicated by company_name, keeping the most
+        similar response's entry; companies without a name are skipped
+        since they can't be de-duplicated.
+        """
+        similar = [(score, response) for score, response in similar if score > COMBINE_SINGLE_THRESHOLD]
+        if sum(score for score, _ in similar) <= COMBINE_TOTAL_THRESHOLD:
+            return None
+
+        merged = {}
+        for _, response in similar:
+            for company in response.get('companies', []):
+                name = company.get('company_name')
+                if name:
+                    merged.setdefault(name, company)
+
+        if len(merged) < number:
+            return None
+
+        logger.info(f"Generative cache hit: merged {len(similar)} cached responses")
+        return {'companies': list(merged.values())[:number]}
+
+    def add(self, profile: str, country: str, industry: str, response: Dict) -> None:
+        """Store a successful response and persist the cache"""
+        if 'error' in response or not response.get('companies'):
+            return
+
+        entry = {
+            'profile': profile,
+            'country': country,
+            'industry': industry,
+            'embedding': self._embed(profile),
+            'response': response
+        }
+        with self.lock:
+            self._insert(entry)
+
+        path = os.path.join(self.entries_dir, f"{uuid.uuid4().hex}.pkl")
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to persist semantic cache entry: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# Singleton instance (the embedding model is expensive to load)
+_semantic_cache = None
+_semantic_cache_checked = False
+_semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> Optional[SemanticPromptCache]:
+    """
+    Get the shared semantic cache.
+
+    Returns:
+        SemanticPromptCache instance, or None if disabled via
+        SEMANTIC_CACHE_ENABLED=0 or its dependencies are not installed
+    """
+    global _semantic_cache, _semantic_cache_checked
+    if not _semantic_cache_checked:
+        with _semantic_cache_lock:
+            if not _semantic_cache_checked:
+                if os.getenv('SEMANTIC_CACHE_ENABLED', '1') != '0':
+                    try:
+                        _semantic_cache = SemanticPromptCache()
+                    except ImportError:
+                        logger.info("Semantic cache disabled: sentence-transformers/faiss not installed")
+                    except Exception as e:
+                        logger.warning(f"Semantic cache not available: {str(e)}")
+                _semantic_cache_checked = True
+    return _semantic_cache
@@ -0,0 +1,56 @@
+"""Tests for lead scoring in context_aware_lead_generator"""
+
+import context_aware_lead_generator as calg
+from context_aware_lead_generator import ContextAwareLeadGenerator
+
+
+INSIGHTS = {
+    'industry': {'primary': 'Insurance'},
+    'target_audience': {'primary': 'b2b'},
+    'geographic_focus': ['Kenya'],
+}
+
+
+def _generator() -> ContextAwareLeadGenerator:
+    # Scoring doesn't touch the Gemini client or cache, so skip __init__
+    return ContextAwareLeadGenerator.__new__(ContextAwareLeadGenerator)
+
+
+def _leads():
+    return [
+        {
+            'company_name': 'Null Fields Ltd',
+            'key_products_services': None,
+            'company_size': None,
+            'target_market': None,
+            'headquarters_location': None,
+        },
+        {
+            'company_name': 'Acme Insurance',
+            'key_products_services': 'Insurance brokerage',
+            'company_size': '1000+ employees',
+            'target_market': 'Enterprise businesses',
+            'headquarters_location': 'Nairobi, Kenya',
+        },
+    ]
+
+
+def test_scoring_handles_none_fields():
+    generator = _generator()
+    leads = _leads()
+
+    scores = generator._calculate_relevance_scores(leads, INSIGHTS)
+
+    assert len(scores) == len(leads)
+    assert all(0 <= score <= 100 for score in scores)
+    for audience in ('enterprise', 'sme', 'b2b', 'b2c'):
+        assert generator._check_audience_match(leads[0], audience) is False
+
+
+def test_vectorized_scoring_matches_per_lead_scorer(monkeypatch):
+    generator = _generator()
+    leads = _leads() * calg.VECTORIZED_SCORING_MIN_LEADS
+    per_lead = list(map(generator._make_scorer(INSIGHTS), leads))
+
+    monkeypatch.setattr(calg, 'VECTORIZED_SCORING_MIN_LEADS', 1)
+    assert generator._calculate_relevance_scores(leads, INSIGHTS) == per_lead
@@ -1,41 +1,160 @@
 # To run this code you need to install the following dependencies:
-# pip install beautifulsoup4 requests
+# pip install beautifulsoup4 requests aiohttp
 
 import re
+import asyncio
+import aiohttp
+import multiprocessing
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from urllib.parse import urljoin, urlparse
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import time
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, List, Set, Optional, Tuple
+from http_session import create_session, is_html_content_type, is_page_url, read_capped, read_capped_async
+from keyword_matcher import KeywordMatcher
+
+# lxml (libxml2) parses several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# selectolax (lexbor) is optional - the scraper only needs a page's links,
+# which lexbor finds in C without building a Python object per node
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# An <a href> node: a lexbor node when selectolax is installed, otherwise a
+# BeautifulSoup Tag
+Anchor = Any
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# An '@' in a raw page body, literal or as an HTML character reference
+_AT_SIGN_BYTES_RE = re.compile(rb'@|&#0*64;|&#x0*40;|&commat;', re.IGNORECASE)
+_MAILTO_HREF_RE = re.compile(r'^mailto:', re.IGNORECASE)
+_MAILTO_EXTRACT_RE = re.compile(r'mailto:([^\?\"\'>\s]+)', re.IGNORECASE)
+
+# Placeholder addresses, image names (e.g. logo@2x.png) and error-reporting
+# DSNs (key@o123.ingest.sentry.io) that look like emails
+_EXCLUDED_EMAIL_RE = re.compile(
+    r'example\.com|domain\.com|email\.com|yourcompany\.com|company\.com|test\.com|sample\.com|placeholder'
+    r'|sentry|@(?:[\w-]+\.)*ingest\.'
+    r'|\.(?:png|jpe?g|gif|svg|webp|avif|ico)$',
+    re.IGNORECASE
+)
+
+# Social profile links; the group name is the platform. Anchored to the
+# link's own host, so a share link (twitter.com/intent/...?url=facebook.com/...)
+# that fails its platform's exclusion can't match a URL in its query string
+_SOCIAL_RE = re.compile(
+    r'^(?:https?:)?//(?:[\w-]+\.)*(?:'
+    r'(?P<linkedin>linkedin\.com/(?:company|in)/)'
+    r'|(?P<twitter>(?:twitter|x)\.com(?![\w.-])(?!/intent/))'
+    r'|(?P<facebook>facebook\.com(?![\w.-])(?!/sharer))'
+    r'|(?P<instagram>instagram\.com(?![\w.-]))'
+    r'|(?P<youtube>(?:youtube\.com|youtu\.be)(?![\w.-])(?!/embed/|/watch\?))'
+    r')',
+    re.IGNORECASE
+)
+
+# Links whose href or text contains one of these may lead to contact details
+_CONTACT_KEYWORDS = KeywordMatcher((
+    'contact', 'contact-us', 'contactus', 'about', 'about-us',
+    'support', 'help', 'get-in-touch', 'reach-us', 'connect'
+))
+
+# Async scraping limits (scrape_company_data_async)
+ASYNC_CONNECTION_LIMIT = 100  # Open connections across all hosts
+ASYNC_LIMIT_PER_HOST = 4  # Concurrent requests to any one website
+DNS_CACHE_TTL = 300  # Seconds
+
+
+def _parse_body(body: bytes, with_text: bool) -> Tuple[List[Anchor], str]:
+    """
+    Parse a page with lexbor when available, BeautifulSoup otherwise.
+    
+    Returns:
+        (the page's <a href> nodes, its visible text when with_text is set
+        or '' otherwise). Script and style contents and attribute values
+        are not part of the text; character references are decoded.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(body)
+        anchors = tree.css('a[href]')
+        if not with_text:
+            return anchors, ''
+        tree.strip_tags(['script', 'style', 'noscript', 'template'])
+        return anchors, tree.text(separator=' ')
+    
+    soup = BeautifulSoup(body, _HTML_PARSER)
+    # get_text() already skips script and style strings
+    return soup.find_all('a', href=True), soup.get_text(' ') if with_text else ''
+
+
+def _href(anchor: Anchor) -> str:
+    """href attribute of an <a> node"""
+    if isinstance(anchor, Tag):
+        return anchor['href']
+    return anchor.attributes.get('href') or ''
+
+
+def _link_text(anchor: Anchor) -> str:
+    """Text content of an <a> node"""
+    if isinstance(anchor, Tag):
+        return anchor.get_text()
+    return anchor.text()
+
 
 class WebScraper:
-    def __init__(self):
+    def __init__(self, connect: bool = True):
+        """
+        Initialize scraper.
+        
+        Args:
+            connect: Open the pooled HTTP session. Parse-only scrapers (the
+                parse_pool workers) skip it, and with it any response cache.
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.timeout = 10
         self.visited_urls = set()
+        # Pooled session: homepage and contact pages reuse connections, and
+        # with requests-cache installed repeat runs reuse cached responses
+        self.session = create_session(self.headers, cached=True) if connect else None
+        # Optional process pool that page parsing is handed to, so threads
+        # only do network IO (see scrape_company_data_parallel)
+        self.parse_pool: Optional[Executor] = None
+    
+    def close(self):
+        """Close the pooled HTTP session"""
+        if self.session is not None:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def extract_emails(self, text: str) -> Set[str]:
         """Extract email addresses from text using regex"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = set(re.findall(email_pattern, text))
-        
-        # Filter out common non-contact emails
-        excluded_patterns = ['example.com', 'domain.com', 'email.com', 'yourcompany.com', 
-                           'company.com', 'test.com', 'sample.com', 'placeholder']
+        # Most page text has no '@' at all; skip the regex scan for it
+        if '@' not in text:
+            return set()
         
-        filtered_emails = set()
-        for email in emails:
-            if not any(pattern in email.lower() for pattern in excluded_patterns):
-                # Also filter out image file extensions that might be caught
-                if not email.lower().endswith(('.png', '.jpg', '.gif', '.svg')):
-                    filtered_emails.add(email)
+        emails = set(_EMAIL_RE.findall(text))
         
-        return filtered_emails
+        # Filter out common non-contact emails and image file names that
+        # might be caught (one regex call per distinct address)
+        return {email for email in emails if not _EXCLUDED_EMAIL_RE.search(email)}
     
-    def extract_social_media(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Optional[str]]:
-        """Extract social media links from the page"""
+    def extract_social_media(self, anchors: List[Anchor], base_url: str) -> Dict[str, Optional[str]]:
+        """Extract social media links from the page's <a href> tags"""
         social_media = {
             'linkedin': None,
             'twitter': None,
@@ -44,98 +163,143 @@ class WebScraper:
             'youtube': None
         }
         
-        # Find all links
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            href = link['href'].lower()
-            
-            # LinkedIn
-            if 'linkedin.com/company' in href or 'linkedin.com/in' in href:
-                if not social_media['linkedin']:
-                    social_media['linkedin'] = link['href'] if link['href'].startswith('http') else urljoin(base_url, link['href'])
-            
-            # Twitter/X
-            elif 'twitter.com' in href or 'x.com' in href:
-                if not social_media['twitter'] and '/intent/' not in href:
-                    social_media['twitter'] = link['href'] if link['href'].startswith('http') else urljoin(base_url, link['href'])
-            
-            # Facebook
-            elif 'facebook.com' in href:
-                if not social_media['facebook'] and '/sharer' not in href:
-                    social_media['facebook'] = link['href'] if link['href'].startswith('http') else urljoin(base_url, link['href'])
-            
-            # Instagram
-            elif 'instagram.com' in href:
-                if not social_media['instagram']:
-                    social_media['instagram'] = link['href'] if link['href'].startswith('http') else urljoin(base_url, link['href'])
-            
-            # YouTube
-            elif 'youtube.com' in href or 'youtu.be' in href:
-                if not social_media['youtube'] and '/embed/' not in href and '/watch?' not in href:
-                    social_media['youtube'] = link['href'] if link['href'].startswith('http') else urljoin(base_url, link['href'])
+        remaining = len(social_media)
+        for link in anchors:
+            # One regex call classifies the link; share/embed links are excluded
+            href = _href(link)
+            match = _SOCIAL_RE.search(href)
+            if match and not social_media[match.lastgroup]:
+                social_media[match.lastgroup] = href if href.startswith('http') else urljoin(base_url, href)
+                remaining -= 1
+                if not remaining:
+                    break  # Every platform found; skip the rest of the page's links
         
         return social_media
     
-    def find_contact_page_urls(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Find potential contact page URLs"""
+    def find_contact_page_urls(
+        self,
+        anchors: List[Anchor],
+        base_url: str,
+        visited: Optional[Set[str]] = None
+    ) -> List[str]:
+        """
+        Find potential contact page URLs among the page's <a href> tags,
+        skipping visited ones (default: self.visited_urls)
+        """
+        if visited is None:
+            visited = self.visited_urls
         contact_urls = []
-        contact_keywords = ['contact', 'contact-us', 'contactus', 'about', 'about-us', 
-                          'support', 'help', 'get-in-touch', 'reach-us', 'connect']
-        
-        links = soup.find_all('a', href=True)
         
-        for link in links:
-            href = link['href'].lower()
-            link_text = link.get_text().lower()
+        for link in anchors:
+            href = _href(link)
+            link_text = _link_text(link).lower()
             
-            # Check if it's a contact-related link
-            if any(keyword in href or keyword in link_text for keyword in contact_keywords):
-                full_url = urljoin(base_url, link['href'])
+            # Check if it's a contact-related link (one pass over href and text)
+            if _CONTACT_KEYWORDS.search(f"{href.lower()}\x00{link_text}"):
+                full_url = urljoin(base_url, href)
                 
-                # Make sure it's from the same domain
-                if urlparse(full_url).netloc == urlparse(base_url).netloc:
-                    if full_url not in contact_urls and full_url not in self.visited_urls:
+                # Make sure it's a page on the same domain, not a download
+                if urlparse(full_url).netloc == urlparse(base_url).netloc and is_page_url(full_url):
+                    if full_url not in contact_urls and full_url not in visited:
                         contact_urls.append(full_url)
         
         return contact_urls[:5]  # Limit to first 5 contact pages
     
     def scrape_page(self, url: str) -> tuple[Set[str], Dict[str, Optional[str]]]:
         """Scrape a single page for emails and social media"""
-        emails = set()
-        social_media = {
-            'linkedin': None,
-            'twitter': None,
-            'facebook': None,
-            'instagram': None,
-            'youtube': None
-        }
-        
+        emails, social_media, _ = self._scrape_page(url)
+        return emails, social_media
+    
+    def _scrape_page(self, url: str, find_contacts: bool = False) -> Tuple[Set[str], Dict[str, Optional[str]], List[str]]:
+        """
+        scrape_page that also returns the page's contact page URLs when
+        find_contacts is set (empty on error). With a parse_pool the page is
+        parsed in a worker process while this thread waits, falling back to
+        parsing in this thread if the pool fails.
+        """
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract emails from page text and HTML
-            page_text = soup.get_text()
-            emails = self.extract_emails(page_text)
-            
-            # Also check mailto links
-            mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.IGNORECASE))
-            for mailto in mailto_links:
-                email_match = re.search(r'mailto:([^\?\"\'>\s]+)', mailto['href'], re.IGNORECASE)
-                if email_match:
-                    emails.add(email_match.group(1))
-            
-            # Extract social media
-            social_media = self.extract_social_media(soup, url)
-            
-            return emails, social_media
+            with self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True) as response:
+                response.raise_for_status()
+                # Headers arrive before the body; don't download non-HTML
+                if not is_html_content_type(response.headers.get('Content-Type')):
+                    return set(), _empty_social_media(), []
+                body = read_capped(response)
+            
+            if self.parse_pool is not None:
+                try:
+                    return self.parse_pool.submit(_parse_page_in_worker, body, url, find_contacts).result()
+                except Exception as e:
+                    # e.g. BrokenProcessPool: parse here rather than lose the page
+                    print(f"Parse pool failed for {url}, parsing in-thread: {str(e)}")
+            return self._parse_page(body, url, find_contacts)
             
         except requests.exceptions.RequestException as e:
             print(f"Error scraping {url}: {str(e)}")
-            return emails, social_media
+            return set(), _empty_social_media(), []
+    
+    def _parse_page(
+        self,
+        body: bytes,
+        url: str,
+        find_contacts: bool = False
+    ) -> Tuple[Set[str], Dict[str, Optional[str]], List[str]]:
+        """
+        Parse a page body and extract emails and social media.
+        
+        Args:
+            body: Raw page body
+            url: Page URL
+            find_contacts: Also look for contact pages linked from this page
+        
+        Returns:
+            (emails, social media, contact page URLs). The page's <a href>
+            tags are collected in one pass and shared by every link scan.
+            Only plain data is returned, so results can cross processes.
+        """
+        # Pages without an '@' anywhere in the raw body skip the text walk
+        anchors, page_text = _parse_body(body, with_text=_AT_SIGN_BYTES_RE.search(body) is not None)
+        
+        # Extract emails from the visible page text
+        emails = self.extract_emails(page_text)
+        
+        # Also check mailto links
+        for mailto in anchors:
+            href = _href(mailto)
+            if not _MAILTO_HREF_RE.match(href):
+                continue
+            email_match = _MAILTO_EXTRACT_RE.search(href)
+            if email_match:
+                emails.add(email_match.group(1))
+        
+        # Extract social media
+        social_media = self.extract_social_media(anchors, url)
+        
+        contact_urls = self.find_contact_page_urls(anchors, url, visited={url}) if find_contacts else []
+        
+        return emails, social_media, contact_urls
+    
+    async def _scrape_page_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        find_contacts: bool = False
+    ) -> Tuple[Set[str], Dict[str, Optional[str]], List[str]]:
+        """Async version of _scrape_page (always parses in-process)"""
+        try:
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                allow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                if not is_html_content_type(response.headers.get('Content-Type')):
+                    return set(), _empty_social_media(), []
+                body = await read_capped_async(response)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error scraping {url}: {str(e)}")
+            return set(), _empty_social_media(), []
+        
+        return self._parse_page(body, url, find_contacts)
     
     def scrape_website(self, base_url: str) -> Dict:
         """Scrape the entire website for contact info and social media"""
@@ -155,7 +319,7 @@ class WebScraper:
         try:
             # First, scrape the homepage
             self.visited_urls.add(base_url)
-            emails, social_media = self.scrape_page(base_url)
+            emails, social_media, contact_urls = self._scrape_page(base_url, find_contacts=True)
             all_emails.update(emails)
             
             # Update social media (keep first found)
@@ -165,12 +329,7 @@ class WebScraper:
             
             print(f"  - Homepage scraped: {len(emails)} emails found")
             
-            # Get the homepage soup to find contact pages
-            response = requests.get(base_url, headers=self.headers, timeout=self.timeout)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find and scrape contact pages
-            contact_urls = self.find_contact_page_urls(soup, base_url)
+            # Scrape the contact pages found among the homepage's links
             print(f"  - Found {len(contact_urls)} potential contact pages")
             
             for contact_url in contact_urls:
@@ -187,30 +346,7 @@ class WebScraper:
                 
                 print(f"  - Scraped {contact_url}: {len(emails)} emails found")
             
-            # Convert emails set to list and get the most likely contact email
-            email_list = list(all_emails)
-            primary_email = None
-            
-            if email_list:
-                # Prioritize emails with contact, info, sales, support keywords
-                priority_keywords = ['contact', 'info', 'hello', 'support', 'sales', 'business']
-                for email in email_list:
-                    if any(keyword in email.lower() for keyword in priority_keywords):
-                        primary_email = email
-                        break
-                
-                # If no priority email found, just use the first one
-                if not primary_email:
-                    primary_email = email_list[0]
-            
-            print(f"  - Total emails found: {len(all_emails)}")
-            print(f"  - Social media accounts found: {sum(1 for v in final_social_media.values() if v)}")
-            
-            return {
-                'contact_email': primary_email,
-                'all_emails': email_list,
-                'social_media': final_social_media
-            }
+            return self._summarize(all_emails, final_social_media)
             
         except Exception as e:
             print(f"  - Error: {str(e)}")
@@ -219,64 +355,144 @@ class WebScraper:
                 'all_emails': [],
                 'social_media': final_social_media
             }
-
-def scrape_company_data(company_data: Dict) -> Dict:
-    """Enhance company data with scraped information"""
-    scraper = WebScraper()
     
-    for company in company_data.get('companies', []):
-        website_url = company.get('website_url')
+    async def scrape_website_async(self, base_url: str, session: aiohttp.ClientSession) -> Dict:
+        """
+        Async version of scrape_website.
         
-        if website_url:
-            scraped_data = scraper.scrape_website(website_url)
+        Contact pages are fetched concurrently, reusing the homepage parse to
+        find them. Politeness is left to the session's per-host connection
+        limit instead of sleeping between requests. Does not touch
+        self.visited_urls, so one scraper can serve many websites at once.
+        
+        Args:
+            base_url: Website URL
+            session: Shared aiohttp session
+        
+        Returns:
+            Same dictionary as scrape_website
+        """
+        print(f"\nScraping: {base_url}")
+        
+        all_emails = set()
+        final_social_media = _empty_social_media()
+        
+        try:
+            # First, scrape the homepage
+            emails, social_media, contact_urls = await self._scrape_page_async(session, base_url, find_contacts=True)
+            all_emails.update(emails)
+            _merge_social_media(final_social_media, social_media)
             
-            # Store LLM email as separate field before overwriting
-            if company.get('contact_email'):
-                company['contact_email_llm'] = company['contact_email']
+            print(f"  - Homepage scraped: {len(emails)} emails found")
             
-            # Update contact email with scraped data (prioritize scraped as it's real-time)
-            if scraped_data['contact_email']:
-                company['contact_email'] = scraped_data['contact_email']
+            # Scrape the contact pages found among the homepage's links
+            print(f"  - Found {len(contact_urls)} potential contact pages")
             
-            # Store all emails found
-            company['additional_emails'] = scraped_data['all_emails']
+            pages = await asyncio.gather(
+                *[self._scrape_page_async(session, contact_url) for contact_url in contact_urls]
+            )
+            for contact_url, (emails, social_media, _) in zip(contact_urls, pages):
+                all_emails.update(emails)
+                _merge_social_media(final_social_media, social_media)
+                print(f"  - Scraped {contact_url}: {len(emails)} emails found")
             
-            # Keep LLM social media in original field
-            # Add scraped social media as verified/real-time data
-            if scraped_data['social_media']:
-                company['social_media_scraped'] = {}
-                for platform, url in scraped_data['social_media'].items():
-                    if url:
-                        company['social_media_scraped'][platform] = url
+            return self._summarize(all_emails, final_social_media)
             
-            # Also fill in missing LLM social media with scraped data
-            for platform, url in scraped_data['social_media'].items():
-                if url and (not company.get('social_media', {}).get(platform)):
-                    if 'social_media' not in company:
-                        company['social_media'] = {}
-                    company['social_media'][platform] = url
+        except Exception as e:
+            print(f"  - Error: {str(e)}")
+            return {
+                'contact_email': None,
+                'all_emails': [],
+                'social_media': final_social_media
+            }
+    
+    def _summarize(self, all_emails: Set[str], final_social_media: Dict[str, Optional[str]]) -> Dict:
+        """Pick the most likely contact email and build the scrape result"""
+        # Convert emails set to list and get the most likely contact email
+        email_list = list(all_emails)
+        primary_email = None
+        
+        if email_list:
+            # Prioritize emails with contact, info, sales, support keywords
+            priority_keywords = ['contact', 'info', 'hello', 'support', 'sales', 'business']
+            for email in email_list:
+                if any(keyword in email.lower() for keyword in priority_keywords):
+                    primary_email = email
+                    break
+            
+            # If no priority email found, just use the first one
+            if not primary_email:
+                primary_email = email_list[0]
+        
+        print(f"  - Total emails found: {len(all_emails)}")
+        print(f"  - Social media accounts found: {sum(1 for v in final_social_media.values() if v)}")
+        
+        return {
+            'contact_email': primary_email,
+            'all_emails': email_list,
+            'social_media': final_social_media
+        }
+
+
+def _empty_social_media() -> Dict[str, Optional[str]]:
+    """Social media result with no accounts found"""
+    return {
+        'linkedin': None,
+        'twitter': None,
+        'facebook': None,
+        'instagram': None,
+        'youtube': None
+    }
+
+
+def _merge_social_media(final_social_media: Dict[str, Optional[str]], social_media: Dict[str, Optional[str]]) -> None:
+    """Fill platforms still missing in final_social_media (keep first found)"""
+    for platform, url in social_media.items():
+        if url and not final_social_media[platform]:
+            final_social_media[platform] = url
+
+def scrape_company_data(company_data: Dict) -> Dict:
+    """Enhance company data with scraped information"""
+    with WebScraper() as scraper:
+        for company in company_data.get('companies', []):
+            website_url = company.get('website_url')
             
-            # Small delay between companies (reduced for speed)
-            time.sleep(0.5)
+            if website_url:
+                scraped_data = scraper.scrape_website(website_url)
+                _apply_scraped_data(company, scraped_data)
+                
+                # Small delay between companies (reduced for speed)
+                time.sleep(0.5)
     
     return company_data
 
 
-def scrape_company_data_parallel(company_data: Dict, max_workers: int = 3) -> Dict:
+def scrape_company_data_parallel(
+    company_data: Dict,
+    max_workers: int = 3,
+    parse_workers: int = 0
+) -> Dict:
     """
     Enhanced version with parallel scraping for faster performance.
     
+    Threads fetch pages. Page parsing and regex work hold the GIL, so for
+    large batches parsing can be handed to a process pool (parse_workers)
+    and the fetching threads only wait on the network and on parse results.
+    
     Args:
         company_data: Dictionary with companies list
         max_workers: Number of parallel workers (default: 3)
+        parse_workers: Processes parsing pages (opt-in; more than
+            max_workers is pointless, as only that many pages are fetched at
+            once). 0, the default, parses in the fetching threads.
     
     Returns:
         Enhanced company data with scraped information
     """
-    from concurrent.futures import ThreadPoolExecutor
     import logging
     
     logger = logging.getLogger(__name__)
+    # One scraper (and pooled session) shared by all worker threads
     scraper = WebScraper()
     companies = company_data.get('companies', [])
     
@@ -288,44 +504,120 @@ def scrape_company_data_parallel(company_data: Dict, max_workers: int = 3) -> Di
         
         try:
             scraped_data = scraper.scrape_website(website_url)
-            
-            # Store LLM email as separate field before overwriting
-            if company.get('contact_email'):
-                company['contact_email_llm'] = company['contact_email']
-            
-            # Update contact email with scraped data (prioritize scraped as it's real-time)
-            if scraped_data['contact_email']:
-                company['contact_email'] = scraped_data['contact_email']
-            
-            # Store all emails found
-            company['additional_emails'] = scraped_data['all_emails']
-            
-            # Keep LLM social media in original field
-            # Add scraped social media as verified/real-time data
-            if scraped_data['social_media']:
-                company['social_media_scraped'] = {}
-                for platform, url in scraped_data['social_media'].items():
-                    if url:
-                        company['social_media_scraped'][platform] = url
-            
-            # Also fill in missing LLM social media with scraped data
-            for platform, url in scraped_data['social_media'].items():
-                if url and (not company.get('social_media', {}).get(platform)):
-                    if 'social_media' not in company:
-                        company['social_media'] = {}
-                    company['social_media'][platform] = url
-            
+            _apply_scraped_data(company, scraped_data)
             return company
         except Exception as e:
             logger.warning(f"Error scraping {website_url}: {str(e)}")
             return company
     
+    if parse_workers > 0:
+        scraper.parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=_parse_pool_context(),
+            initializer=_init_parse_worker
+        )
+    
     # Use ThreadPoolExecutor for parallel scraping
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results = list(executor.map(scrape_single_company, companies))
+    try:
+        with scraper, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(scrape_single_company, companies))
+    finally:
+        if scraper.parse_pool is not None:
+            scraper.parse_pool.shutdown()
+            scraper.parse_pool = None
     
     return {'companies': results}
 
+
+def _parse_pool_context():
+    """forkserver start method where available: workers fork from a small
+    server process that has already imported this module (and lxml)"""
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+# Scraper used by page-parsing worker processes (set by _init_parse_worker)
+_worker_scraper = None
+
+
+def _init_parse_worker() -> None:
+    """Create the worker process's parse-only scraper once instead of per page"""
+    global _worker_scraper
+    _worker_scraper = WebScraper(connect=False)
+
+
+def _parse_page_in_worker(
+    body: bytes,
+    url: str,
+    find_contacts: bool
+) -> Tuple[Set[str], Dict[str, Optional[str]], List[str]]:
+    """WebScraper._parse_page run in a parse_pool worker; only the body and URL are pickled"""
+    return _worker_scraper._parse_page(body, url, find_contacts)
+
+
+async def scrape_company_data_async(company_data: Dict) -> Dict:
+    """
+    Async version of scrape_company_data_parallel: every company's website
+    is scraped concurrently over one pooled aiohttp session.
+    
+    Args:
+        company_data: Dictionary with companies list
+    
+    Returns:
+        Enhanced company data with scraped information
+    """
+    companies = company_data.get('companies', [])
+    to_scrape = [company for company in companies if company.get('website_url')]
+    
+    connector = aiohttp.TCPConnector(
+        limit=ASYNC_CONNECTION_LIMIT,
+        limit_per_host=ASYNC_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL
+    )
+    # Pages are fetched over the aiohttp session, so skip the sync one
+    scraper = WebScraper(connect=False)
+    async with aiohttp.ClientSession(connector=connector, headers=scraper.headers) as session:
+        results = await asyncio.gather(
+            *[scraper.scrape_website_async(company['website_url'], session) for company in to_scrape]
+        )
+    
+    for company, scraped_data in zip(to_scrape, results):
+        _apply_scraped_data(company, scraped_data)
+    
+    return {'companies': companies}
+
+
+def _apply_scraped_data(company: Dict, scraped_data: Dict) -> None:
+    """Merge a scrape_website result into a company's lead data"""
+    # Store LLM email as separate field before overwriting
+    if company.get('contact_email'):
+        company['contact_email_llm'] = company['contact_email']
+    
+    # Update contact email with scraped data (prioritize scraped as it's real-time)
+    if scraped_data['contact_email']:
+        company['contact_email'] = scraped_data['contact_email']
+    
+    # Store all emails found
+    company['additional_emails'] = scraped_data['all_emails']
+    
+    # Keep LLM social media in original field
+    # Add scraped social media as verified/real-time data
+    if scraped_data['social_media']:
+        company['social_media_scraped'] = {}
+        for platform, url in scraped_data['social_media'].items():
+            if url:
+                company['social_media_scraped'][platform] = url
+    
+    # Also fill in missing LLM social media with scraped data
+    for platform, url in scraped_data['social_media'].items():
+        if url and (not company.get('social_media', {}).get(platform)):
+            if 'social_media' not in company:
+                company['social_media'] = {}
+            company['social_media'][platform] = url
+
 if __name__ == '__main__':
     # Example usage
     scraper = WebScraper()
@@ -4,18 +4,74 @@ Retrieves and parses website content (HTML, metadata, structured data)
 for deep business intelligence extraction.
 """
 
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Set
-import re
+from bs4 import BeautifulSoup, Tag
+from typing import Callable, Dict, List, Optional, Set
+import sys
 import json
 from urllib.parse import urljoin, urlparse
 import logging
+from collections import Counter
 from dataclasses import dataclass
 import time
+from http_session import create_session, is_html_content_type, is_page_url, read_capped, read_capped_async
+from keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# lxml (libxml2) parses several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# orjson is optional - parses large JSON-LD blocks several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Links whose href or text contains one of these lead to pages worth analyzing
+_IMPORTANT_PAGE_KEYWORDS = KeywordMatcher((
+    'about', 'product', 'service', 'solution', 'pricing',
+    'contact', 'features', 'benefits', 'how-it-works'
+))
+
+# Characters of page text kept in WebsiteContent.text_content
+MAX_TEXT_CONTENT = 50000
+
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Tags counted by _analyze_html_structure
+_STRUCTURE_TAGS = ['nav', 'header', 'footer', 'form', 'video', 'iframe', 'section', 'article', 'button', 'input']
+
+
+
+def _append_unique(existing: List, additional: List, key: Optional[Callable] = None) -> List:
+    """
+    Return existing plus the items of additional not already present.
+
+    Membership is tracked in a set, so merging is linear rather than a list
+    scan per item. Duplicates within additional are dropped too.
+
+    Args:
+        existing: Items to keep as-is
+        additional: Items to append when new
+        key: Function giving the identity of an item (defaults to the item)
+    """
+    seen = set(map(key, existing)) if key else set(existing)
+    merged = list(existing)
+    for item in additional:
+        item_key = key(item) if key else item
+        if item_key not in seen:
+            seen.add(item_key)
+            merged.append(item)
+    return merged
+
 
 @dataclass
 class WebsiteContent:
@@ -31,6 +87,8 @@ class WebsiteContent:
     structured_data: List[Dict]
     text_content: str
     html_structure: Dict
+    etag: Optional[str] = None  # Main page validators, for conditional re-fetching
+    last_modified: Optional[str] = None
 
 
 class WebsiteContentAnalyzer:
@@ -39,16 +97,19 @@ class WebsiteContentAnalyzer:
     Optimized for speed and accuracy with minimal external dependencies.
     """
     
-    def __init__(self, timeout: int = 15, max_pages: int = 3):
+    def __init__(self, timeout: int = 15, max_pages: int = 3, structural_analysis: bool = False):
         """
         Initialize analyzer.
         
         Args:
             timeout: Request timeout in seconds
             max_pages: Maximum number of pages to analyze
+            structural_analysis: Fill WebsiteContent.html_structure (navbar,
+                forms, section counts, ...); left empty when False
         """
         self.timeout = timeout
         self.max_pages = max_pages
+        self.structural_analysis = structural_analysis
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -57,13 +118,38 @@ class WebsiteContentAnalyzer:
             'Connection': 'keep-alive',
         }
         self.visited_urls: Set[str] = set()
+        # Pooled session: main and additional pages reuse connections.
+        # Created on the first sync fetch; the async path never needs it.
+        self._session = None
+    
+    @property
+    def session(self):
+        """Pooled HTTP session for sync fetches, created on first use"""
+        if self._session is None:
+            self._session = create_session(self.headers)
+        return self._session
+    
+    def close(self):
+        """Close the pooled HTTP session if one was created"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def fetch_website(self, url: str) -> Optional[WebsiteContent]:
+    def fetch_website(self, url: str, previous: Optional[WebsiteContent] = None) -> Optional[WebsiteContent]:
         """
         Fetch and parse website content.
         
         Args:
             url: Website URL to analyze
+            previous: Earlier analysis of the same site. Its ETag/Last-Modified
+                are sent as validators and it is returned as-is if the main
+                page is unchanged (304 Not Modified).
         
         Returns:
             WebsiteContent object or None if error
@@ -76,16 +162,26 @@ class WebsiteContentAnalyzer:
             logger.info(f"Fetching website: {url}")
             
             # Fetch main page
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
+            with self.session.get(
+                url, headers=self._conditional_headers(previous), timeout=self.timeout, allow_redirects=True, stream=True
+            ) as response:
+                if previous is not None and response.status_code == 304:
+                    logger.info(f"Website not modified since last analysis: {url}")
+                    return previous
+                response.raise_for_status()
+                body = read_capped(response)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(body, _HTML_PARSER)
             
-            # Extract basic content
-            content = self._extract_content(soup, url)
+            # Extract basic content (the page's links are collected once and
+            # shared with the important-page scan)
+            anchors = soup.find_all('a', href=True)
+            content = self._extract_content(soup, url, anchors)
+            content.etag = response.headers.get('ETag')
+            content.last_modified = response.headers.get('Last-Modified')
             
             # Fetch additional pages for context
-            additional_pages = self._get_important_pages(soup, url)
+            additional_pages = self._get_important_pages(anchors, url)
             for page_url in additional_pages[:self.max_pages - 1]:
                 if page_url not in self.visited_urls:
                     try:
@@ -105,8 +201,129 @@ class WebsiteContentAnalyzer:
             logger.error(f"Unexpected error analyzing {url}: {str(e)}")
             return None
     
-    def _extract_content(self, soup: BeautifulSoup, base_url: str) -> WebsiteContent:
-        """Extract all content from a page"""
+    async def fetch_website_async(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        previous: Optional[WebsiteContent] = None
+    ) -> Optional[WebsiteContent]:
+        """
+        Async version of fetch_website using a shared aiohttp session.
+        
+        Additional pages are fetched concurrently.
+        
+        Args:
+            url: Website URL to analyze
+            session: aiohttp session (reused across websites for connection pooling)
+            previous: Earlier analysis of the same site, revalidated as in fetch_website
+        
+        Returns:
+            WebsiteContent object or None if error
+        """
+        try:
+            # Normalize URL
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            
+            logger.info(f"Fetching website: {url}")
+            
+            # Fetch main page
+            async with session.get(
+                url,
+                headers=self._conditional_headers(previous),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                allow_redirects=True
+            ) as response:
+                if previous is not None and response.status == 304:
+                    logger.info(f"Website not modified since last analysis: {url}")
+                    return previous
+                response.raise_for_status()
+                body = await read_capped_async(response)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            soup = BeautifulSoup(body, _HTML_PARSER)
+            
+            # Extract basic content
+            anchors = soup.find_all('a', href=True)
+            content = self._extract_content(soup, url, anchors)
+            content.etag = etag
+            content.last_modified = last_modified
+            
+            # Fetch additional pages for context
+            additional_pages = [
+                page_url for page_url in self._get_important_pages(anchors, url)[:self.max_pages - 1]
+                if page_url not in self.visited_urls
+            ]
+            page_contents = await asyncio.gather(
+                *[self._fetch_page_async(page_url, session) for page_url in additional_pages]
+            )
+            for page_content in page_contents:
+                if page_content:
+                    content = self._merge_content(content, page_content)
+            
+            return content
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching website {url}: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error analyzing {url}: {str(e)}")
+            return None
+    
+    def _conditional_headers(self, previous: Optional[WebsiteContent]) -> Dict:
+        """Request headers, plus validators from a previous analysis if it has any"""
+        if previous is None or not (previous.etag or previous.last_modified):
+            return self.headers
+        
+        headers = dict(self.headers)
+        if previous.etag:
+            headers['If-None-Match'] = previous.etag
+        if previous.last_modified:
+            headers['If-Modified-Since'] = previous.last_modified
+        return headers
+    
+    async def _get_async(self, url: str, session: aiohttp.ClientSession) -> Optional[bytes]:
+        """GET a page and return its raw body (capped at MAX_PAGE_BYTES), or None if it isn't HTML"""
+        async with session.get(
+            url,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as response:
+            response.raise_for_status()
+            if not is_html_content_type(response.headers.get('Content-Type')):
+                return None
+            return await read_capped_async(response)
+    
+    async def _fetch_page_async(self, url: str, session: aiohttp.ClientSession) -> Optional[WebsiteContent]:
+        """Fetch a single page asynchronously"""
+        try:
+            self.visited_urls.add(url)
+            body = await self._get_async(url, session)
+            if body is None:
+                return None
+            soup = BeautifulSoup(body, _HTML_PARSER)
+            return self._extract_content(soup, url)
+        except Exception as e:
+            logger.warning(f"Error fetching page {url}: {str(e)}")
+            return None
+    
+    def _extract_content(
+        self,
+        soup: BeautifulSoup,
+        base_url: str,
+        anchors: Optional[List[Tag]] = None
+    ) -> WebsiteContent:
+        """
+        Extract all content from a page.
+        
+        Args:
+            soup: Parsed page
+            base_url: Page URL
+            anchors: The page's <a href> tags, if the caller already collected them
+        """
+        if anchors is None:
+            anchors = soup.find_all('a', href=True)
         
         # Title
         title = soup.find('title')
@@ -123,11 +340,10 @@ class WebsiteContentAnalyzer:
         
         # Headings (h1-h6)
         headings = []
-        for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            for heading in soup.find_all(tag):
-                text = heading.get_text(strip=True)
-                if text and len(text) > 3:
-                    headings.append(text)
+        for heading in soup.find_all(_HEADING_TAGS):
+            text = heading.get_text(strip=True)
+            if text and len(text) > 3:
+                headings.append(text)
         
         # Paragraphs
         paragraphs = []
@@ -138,7 +354,7 @@ class WebsiteContentAnalyzer:
         
         # Links
         links = []
-        for a in soup.find_all('a', href=True):
+        for a in anchors:
             href = a['href']
             link_text = a.get_text(strip=True)
             if href.startswith('http') or href.startswith('/'):
@@ -159,11 +375,11 @@ class WebsiteContentAnalyzer:
         # Structured data (JSON-LD, Microdata, RDFa)
         structured_data = self._extract_structured_data(soup)
         
-        # Full text content
-        text_content = soup.get_text(separator=' ', strip=True)
+        # Full text content (capped here so oversized pages aren't carried around)
+        text_content = soup.get_text(separator=' ', strip=True)[:MAX_TEXT_CONTENT]
         
-        # HTML structure analysis
-        html_structure = self._analyze_html_structure(soup)
+        # HTML structure analysis (opt-in; nothing downstream reads it by default)
+        html_structure = self._analyze_html_structure(soup) if self.structural_analysis else {}
         
         return WebsiteContent(
             url=base_url,
@@ -180,33 +396,43 @@ class WebsiteContentAnalyzer:
         )
     
     def _extract_metadata(self, soup: BeautifulSoup) -> Dict:
-        """Extract all metadata from page"""
+        """
+        Extract all metadata from page.
+        
+        Meta tags are walked once for plain, Open Graph and Twitter Card
+        entries. Keys are interned: the same few names ('description',
+        'og:title', ...) recur on every page, so each is stored once and
+        dict lookups on them compare by identity.
+        """
         metadata = {}
+        og_tags = {}
+        twitter_tags = {}
         
-        # Meta tags
         for meta in soup.find_all('meta'):
-            name = meta.get('name') or meta.get('property') or meta.get('itemprop')
             content = meta.get('content')
-            if name and content:
-                metadata[name] = content
+            if not content:
+                continue
+            
+            prop = meta.get('property')
+            meta_name = meta.get('name')
+            name = meta_name or prop or meta.get('itemprop')
+            if name:
+                metadata[sys.intern(name)] = content
+            
+            # Open Graph
+            if prop and prop.startswith('og:'):
+                og_name = prop.replace('og:', '')
+                if og_name:
+                    og_tags[sys.intern(og_name)] = content
+            
+            # Twitter Cards
+            if meta_name and meta_name.startswith('twitter:'):
+                twitter_name = meta_name.replace('twitter:', '')
+                if twitter_name:
+                    twitter_tags[sys.intern(twitter_name)] = content
         
-        # Open Graph
-        og_tags = {}
-        for meta in soup.find_all('meta', property=re.compile(r'^og:')):
-            prop = meta.get('property', '').replace('og:', '')
-            content = meta.get('content')
-            if prop and content:
-                og_tags[prop] = content
         if og_tags:
             metadata['open_graph'] = og_tags
-        
-        # Twitter Cards
-        twitter_tags = {}
-        for meta in soup.find_all('meta', attrs={'name': re.compile(r'^twitter:')}):
-            name = meta.get('name', '').replace('twitter:', '')
-            content = meta.get('content')
-            if name and content:
-                twitter_tags[name] = content
         if twitter_tags:
             metadata['twitter'] = twitter_tags
         
@@ -218,13 +444,16 @@ class WebsiteContentAnalyzer:
         
         # JSON-LD
         for script in soup.find_all('script', type='application/ld+json'):
+            if not script.string:
+                continue
             try:
-                data = json.loads(script.string)
+                # orjson only takes exact str, not bs4's NavigableString subclass
+                data = _json_loads(str(script.string))
                 structured_data.append({
                     'type': 'json-ld',
                     'data': data
                 })
-            except (json.JSONDecodeError, AttributeError):
+            except ValueError:  # json and orjson decode errors both subclass it
                 continue
         
         # Microdata
@@ -254,35 +483,41 @@ class WebsiteContentAnalyzer:
     
     def _analyze_html_structure(self, soup: BeautifulSoup) -> Dict:
         """Analyze HTML structure for business intelligence"""
+        # Count every tag of interest in a single walk
+        counts = Counter(tag.name for tag in soup.find_all(_STRUCTURE_TAGS))
+        
+        # First 20 distinct class names, stopping as soon as they are found
+        class_names = {}
+        for elem in soup.find_all(class_=True):
+            for cls in elem.get('class', []):
+                class_names.setdefault(cls)
+            if len(class_names) >= 20:
+                break
+        
         structure = {
-            'has_navbar': len(soup.find_all(['nav', 'header'])) > 0,
-            'has_footer': len(soup.find_all('footer')) > 0,
-            'has_forms': len(soup.find_all('form')) > 0,
-            'has_videos': len(soup.find_all(['video', 'iframe'])) > 0,
-            'section_count': len(soup.find_all('section')),
-            'article_count': len(soup.find_all('article')),
-            'button_count': len(soup.find_all('button')),
-            'input_count': len(soup.find_all('input')),
-            'class_names': list(set([cls for elem in soup.find_all(class_=True) for cls in elem.get('class', [])]))[:20]
+            'has_navbar': counts['nav'] + counts['header'] > 0,
+            'has_footer': counts['footer'] > 0,
+            'has_forms': counts['form'] > 0,
+            'has_videos': counts['video'] + counts['iframe'] > 0,
+            'section_count': counts['section'],
+            'article_count': counts['article'],
+            'button_count': counts['button'],
+            'input_count': counts['input'],
+            'class_names': list(class_names)[:20]
         }
         
         return structure
     
-    def _get_important_pages(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Get URLs of important pages (About, Products, Services, etc.)"""
-        important_keywords = [
-            'about', 'product', 'service', 'solution', 'pricing', 
-            'contact', 'features', 'benefits', 'how-it-works'
-        ]
-        
+    def _get_important_pages(self, anchors: List[Tag], base_url: str) -> List[str]:
+        """Get URLs of important pages (About, Products, Services, etc.) from a page's <a href> tags"""
         important_urls = []
-        for a in soup.find_all('a', href=True):
+        for a in anchors:
             href = a['href'].lower()
             link_text = a.get_text(strip=True).lower()
             
-            if any(keyword in href or keyword in link_text for keyword in important_keywords):
+            if _IMPORTANT_PAGE_KEYWORDS.search(f"{href}\x00{link_text}"):
                 full_url = urljoin(base_url, a['href'])
-                if urlparse(full_url).netloc == urlparse(base_url).netloc:
+                if urlparse(full_url).netloc == urlparse(base_url).netloc and is_page_url(full_url):
                     important_urls.append(full_url)
         
         return list(set(important_urls))[:5]  # Limit to 5 pages
@@ -291,9 +526,13 @@ class WebsiteContentAnalyzer:
         """Fetch a single page"""
         try:
             self.visited_urls.add(url)
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                # Headers arrive before the body; don't download non-HTML
+                if not is_html_content_type(response.headers.get('Content-Type')):
+                    return None
+                body = read_capped(response)
+            soup = BeautifulSoup(body, _HTML_PARSER)
             return self._extract_content(soup, url)
         except Exception as e:
             logger.warning(f"Error fetching page {url}: {str(e)}")
@@ -302,14 +541,13 @@ class WebsiteContentAnalyzer:
     def _merge_content(self, main: WebsiteContent, additional: WebsiteContent) -> WebsiteContent:
         """Merge content from additional pages into main content"""
         # Merge headings (avoid duplicates)
-        all_headings = main.headings + [h for h in additional.headings if h not in main.headings]
+        all_headings = _append_unique(main.headings, additional.headings)
         
         # Merge paragraphs
-        all_paragraphs = main.paragraphs + [p for p in additional.paragraphs if p not in main.paragraphs]
+        all_paragraphs = _append_unique(main.paragraphs, additional.paragraphs)
         
         # Merge links
-        existing_urls = {link['url'] for link in main.links}
-        all_links = main.links + [link for link in additional.links if link['url'] not in existing_urls]
+        all_links = _append_unique(main.links, additional.links, key=lambda link: link['url'])
         
         # Merge text content
         combined_text = main.text_content + " " + additional.text_content
@@ -318,21 +556,41 @@ class WebsiteContentAnalyzer:
         main.headings = all_headings[:50]  # Limit to prevent bloat
         main.paragraphs = all_paragraphs[:100]
         main.links = all_links[:200]
-        main.text_content = combined_text[:50000]  # Limit text content
+        main.text_content = combined_text[:MAX_TEXT_CONTENT]  # Limit text content
         
         return main
 
 
-def analyze_website_content(url: str) -> Optional[WebsiteContent]:
+def analyze_website_content(url: str, previous: Optional[WebsiteContent] = None) -> Optional[WebsiteContent]:
     """
     Convenience function to analyze website content.
     
     Args:
         url: Website URL to analyze
+        previous: Optional earlier analysis, returned as-is if the site is unchanged
     
     Returns:
         WebsiteContent object or None
     """
-    analyzer = WebsiteContentAnalyzer()
-    return analyzer.fetch_website(url)
+    with WebsiteContentAnalyzer() as analyzer:
+        return analyzer.fetch_website(url, previous)
+
 
+async def analyze_website_content_async(
+    url: str,
+    session: aiohttp.ClientSession,
+    previous: Optional[WebsiteContent] = None
+) -> Optional[WebsiteContent]:
+    """
+    Async convenience function to analyze website content.
+    
+    Args:
+        url: Website URL to analyze
+        session: Shared aiohttp session
+        previous: Optional earlier analysis, returned as-is if the site is unchanged
+    
+    Returns:
+        WebsiteContent object or None
+    """
+    with WebsiteContentAnalyzer() as analyzer:
+        return await analyzer.fetch_website_async(url, session, previous)